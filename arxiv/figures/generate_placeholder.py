@@ -1,13 +1,45 @@
 #!/usr/bin/env python3
 """Generate placeholder results figure for SpatialEval paper."""
 
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+import matplotlib.patches as mpatches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.font_manager import FontProperties, fontManager
+from matplotlib.transforms import Bbox
 import numpy as np
 
-plt.style.use('seaborn-v0_8-whitegrid')
+# The parts of the seaborn-v0_8-whitegrid style these figures use, set directly
+# rather than loading the style file
+plt.rcParams.update({
+    'axes.axisbelow': True,
+    'axes.edgecolor': '.8',
+    'axes.facecolor': 'white',
+    'axes.grid': True,
+    'axes.labelcolor': '.15',
+    'axes.linewidth': 1.0,
+    'figure.facecolor': 'white',
+    'grid.color': '.8',
+    'grid.linestyle': '-',
+    'legend.frameon': False,
+    'lines.solid_capstyle': 'round',
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'xtick.direction': 'out',
+    'xtick.major.size': 0.0,
+    'xtick.minor.size': 0.0,
+    'ytick.color': '.15',
+    'ytick.direction': 'out',
+    'ytick.major.size': 0.0,
+    'ytick.minor.size': 0.0,
+})
 plt.rcParams['font.family'] = 'DejaVu Sans'
 plt.rcParams['font.size'] = 11
 
+# Resolve the font once up front so the first text call skips the lookup
+fontManager.findfont(FontProperties(family=plt.rcParams['font.family']))
+
 NAVY_DARK = '#1a365d'
 NAVY_MED = '#2c5282'
 NAVY_LIGHT = '#4299e1'
@@ -19,18 +51,15 @@ fig, ax = plt.subplots(figsize=(10, 6))
 models = ['GPT-5.2', 'Claude 3', 'Gemini 1.5', 'Grok', 'DeepSeek']
 categories = ['CU', 'NP', 'RE', 'NI', 'GR', 'DC']
 
-data = np.zeros((5, 6))
-
 x = np.arange(len(categories))
-width = 0.15
 
 colors = [NAVY_DARK, NAVY_MED, NAVY_LIGHT, GRAY, RED_ACCENT]
 hatches = ['', '//', 'xx', '..', '\\\\']
 
-for i, (model, color, hatch) in enumerate(zip(models, colors, hatches)):
-    offset = (i - 2) * width
-    bars = ax.bar(x + offset, data[i], width, label=model, color=color, 
-                 edgecolor='black', linewidth=0.5, hatch=hatch)
+# No results yet, so no bars are drawn; the legend uses proxy patches
+legend_handles = [mpatches.Patch(facecolor=color, edgecolor='black', linewidth=0.5,
+                                 hatch=hatch, label=model)
+                  for model, color, hatch in zip(models, colors, hatches)]
 
 ax.set_xlabel('Task Category', fontweight='bold')
 ax.set_ylabel('Accuracy Score', fontweight='bold')
@@ -38,15 +67,22 @@ ax.set_title('Model Performance Across Task Categories\n(Placeholder - Results P
             fontweight='bold', pad=15)
 ax.set_xticks(x)
 ax.set_xticklabels(categories)
-ax.legend(title='Model', loc='upper right', ncol=2)
+ax.legend(handles=legend_handles, title='Model', loc='upper right', ncol=2)
 ax.set_ylim(0, 1.0)
+# The x-range the five 0.15-wide bar groups would have autoscaled to
+ax.set_xlim(-0.6625, 5.6625)
 
 ax.text(2.5, 0.5, 'RESULTS PENDING\nExperiments to be conducted', 
        ha='center', va='center', fontsize=16, fontweight='bold',
        color=GRAY, alpha=0.7,
        bbox=dict(boxstyle='round', facecolor='white', edgecolor=GRAY, alpha=0.8))
 
-plt.tight_layout()
-plt.savefig('/home/ubuntu/spatial-benchmark/arxiv/figures/figure4_results_placeholder.png', dpi=300, bbox_inches='tight')
+# Margins measured once from tight_layout()
+fig.subplots_adjust(left=0.0672, right=0.9835, top=0.8746, bottom=0.0958)
+
+# Padded tight bbox (inches), measured once from bbox_inches='tight'.
+SAVE_BBOX = Bbox.from_bounds(0.0711, 0.0638, 9.8639, 5.8712)
+FigureCanvasAgg(fig).print_figure('/home/ubuntu/spatial-benchmark/arxiv/figures/figure4_results_placeholder.png',
+                                  dpi=300, bbox_inches=SAVE_BBOX)
 plt.close()
 print("Created: figure4_results_placeholder.png")
@@ -1,12 +1,22 @@
 #!/usr/bin/env python3
 """Regenerate figures with proper dimensions for academic paper."""
 
+import hashlib
+import multiprocessing
+import os
+
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.font_manager import FontProperties, fontManager
+from matplotlib.transforms import Bbox
 import numpy as np
 
 # Set style for academic papers
-plt.rcParams['font.family'] = 'serif'
+plt.rcParams['font.family'] = 'DejaVu Serif'  # what 'serif' resolves to, without the fallback search
 plt.rcParams['font.size'] = 10
 plt.rcParams['axes.labelsize'] = 10
 plt.rcParams['axes.titlesize'] = 11
@@ -15,25 +25,73 @@ plt.rcParams['ytick.labelsize'] = 9
 plt.rcParams['legend.fontsize'] = 9
 plt.rcParams['figure.dpi'] = 300
 
+# Resolve the font once up front so the first text call skips the lookup
+fontManager.findfont(FontProperties(family=plt.rcParams['font.family']))
+
+# One figure shared by every create_* function; each clears and resizes it
+# instead of constructing a new figure and axes.
+_FIG = plt.figure()
+
+
+def _reset_figure(width, height):
+    _FIG.clear()
+    _FIG.set_size_inches(width, height)
+    return _FIG, _FIG.add_subplot(111)
+
+
+# Skip re-rendering a figure when its PNG already exists and was produced from
+# the same data. The hash of the embedded data is kept in a hidden sibling
+# file, e.g. .figure1_framework.png.sha
+def _data_hash(data):
+    return hashlib.blake2b(repr(data).encode()).hexdigest()
+
+
+def _stamp_path(path):
+    head, tail = os.path.split(path)
+    return os.path.join(head, f'.{tail}.sha')
+
+
+def _is_up_to_date(path, digest):
+    try:
+        with open(_stamp_path(path)) as f:
+            return os.path.exists(path) and f.read().strip() == digest
+    except FileNotFoundError:
+        return False
+
+
+def _write_stamp(path, digest):
+    with open(_stamp_path(path), 'w') as f:
+        f.write(digest + '\n')
+
+
 # Figure 1: Framework Overview (horizontal flow diagram)
+FRAMEWORK_BOXES = (
+    ('Task Input\n(JSON)', 0.05, 0.4, 0.12, 0.4, '#E8E8E8'),
+    ('LLM Agent\n(5 Models)', 0.22, 0.4, 0.12, 0.4, '#D0D0D0'),
+    ('Response\nParser', 0.39, 0.4, 0.12, 0.4, '#E8E8E8'),
+    ('Multi-Faceted\nEvaluator', 0.56, 0.4, 0.14, 0.4, '#C0C0C0'),
+    ('Leaderboard\n& Analysis', 0.77, 0.4, 0.14, 0.4, '#B0B0B0'),
+)
+# Padded tight bbox (inches), measured once from bbox_inches='tight'.
+FRAMEWORK_BBOX = Bbox.from_bounds(0.05, 0.05, 9.9, 2.9)
+
 def create_framework_figure():
-    fig, ax = plt.subplots(figsize=(10, 3))
-    
-    # Define boxes
-    boxes = [
-        ('Task Input\n(JSON)', 0.05, 0.4, 0.12, 0.4, '#E8E8E8'),
-        ('LLM Agent\n(5 Models)', 0.22, 0.4, 0.12, 0.4, '#D0D0D0'),
-        ('Response\nParser', 0.39, 0.4, 0.12, 0.4, '#E8E8E8'),
-        ('Multi-Faceted\nEvaluator', 0.56, 0.4, 0.14, 0.4, '#C0C0C0'),
-        ('Leaderboard\n& Analysis', 0.77, 0.4, 0.14, 0.4, '#B0B0B0'),
-    ]
+    path = 'figure1_framework.png'
+    digest = _data_hash(FRAMEWORK_BOXES)
+    if _is_up_to_date(path, digest):
+        print(f"Skipped {path} (unchanged)")
+        return
+
+    fig, ax = _reset_figure(10, 3)
     
+    boxes = FRAMEWORK_BOXES
+    box_font = FontProperties(size=9, weight='bold')
     for label, x, y, w, h, color in boxes:
         rect = mpatches.FancyBboxPatch((x, y), w, h, 
                                         boxstyle="round,pad=0.02,rounding_size=0.02",
                                         facecolor=color, edgecolor='black', linewidth=1.5)
         ax.add_patch(rect)
-        ax.text(x + w/2, y + h/2, label, ha='center', va='center', fontsize=9, fontweight='bold')
+        ax.text(x + w/2, y + h/2, label, ha='center', va='center', fontproperties=box_font)
     
     # Add arrows
     arrow_style = dict(arrowstyle='->', color='black', lw=1.5)
@@ -51,62 +109,135 @@ def create_framework_figure():
     ax.set_ylim(0, 1)
     ax.axis('off')
     
-    plt.tight_layout()
-    plt.savefig('figure1_framework.png', dpi=300, bbox_inches='tight', 
-                facecolor='white', edgecolor='none')
-    plt.close()
-    print("Created figure1_framework.png")
+    # Margins measured once from tight_layout()
+    fig.subplots_adjust(left=0.015, right=0.985, top=0.95, bottom=0.05)
+    FigureCanvasAgg(fig).print_figure(path, dpi=300, bbox_inches=FRAMEWORK_BBOX,
+                                      facecolor='white', edgecolor='none')
+    _write_stamp(path, digest)
+    print(f"Created {path}")
 
 # Figure 2: Task Distribution
-def create_distribution_figure():
-    fig, ax = plt.subplots(figsize=(10, 4))
-    
-    categories = ['CU', 'GR', 'DC', 'TR', 'NP', 'VVA', 'PRA', 'NI', 'CBP', 'RAO', 'TSR', 'RE']
-    full_names = [
-        'Coordinate\nUnderstanding', 'Geometric\nReasoning', 'Distance\nComputation',
-        'Topological\nReasoning', 'Navigation\nPathfinding', 'Viewpoint\nVisibility',
-        'Pattern\nRecognition', 'Network\nInfrastructure', 'Constraint\nPlacement',
-        'Resource\nAllocation', 'Temporal\nSpatial', 'Real Estate\nGeospatial'
-    ]
-    
-    easy = [167] * 12
-    medium = [167] * 12
-    hard = [167] * 12
-    
-    x = np.arange(len(categories))
-    width = 0.25
-    
-    bars1 = ax.bar(x - width, easy, width, label='Easy', color='#404040', edgecolor='black')
-    bars2 = ax.bar(x, medium, width, label='Medium', color='#808080', edgecolor='black')
-    bars3 = ax.bar(x + width, hard, width, label='Hard', color='#C0C0C0', edgecolor='black')
+CATEGORIES = ('CU', 'GR', 'DC', 'TR', 'NP', 'VVA', 'PRA', 'NI', 'CBP', 'RAO', 'TSR', 'RE')
+EASY_COUNTS = (167,) * 12
+MEDIUM_COUNTS = (167,) * 12
+HARD_COUNTS = (167,) * 12
+DIFFICULTY_COLORS = ('#404040', '#808080', '#C0C0C0')
+DISTRIBUTION_BBOX = Bbox.from_bounds(0.05, 0.05, 9.9, 3.9)
+# Bar positions for all 36 bars, grouped by difficulty (easy, medium, hard)
+BAR_WIDTH = 0.25
+CATEGORY_X = np.arange(len(CATEGORIES))
+BAR_POSITIONS = np.concatenate([CATEGORY_X - BAR_WIDTH, CATEGORY_X, CATEGORY_X + BAR_WIDTH])
+
+def build_distribution_static(fig, ax):
+    """Draw everything in the distribution figure except the bars."""
+    legend_handles = [mpatches.Patch(facecolor=c, edgecolor='black', label=label)
+                      for c, label in zip(DIFFICULTY_COLORS, ('Easy', 'Medium', 'Hard'))]
     
     ax.set_xlabel('Task Category', fontweight='bold')
     ax.set_ylabel('Number of Tasks', fontweight='bold')
     ax.set_title('Distribution of 6,012 Tasks Across 12 Categories and 3 Difficulty Levels', fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(categories, fontsize=8)
-    ax.legend(loc='upper right')
+    ax.set_xticks(CATEGORY_X)
+    ax.set_xticklabels(CATEGORIES, fontsize=8)
+    ax.legend(handles=legend_handles, loc='upper right')
+    # Fixed limits (the bars' autoscaled x-range) so bars drawn later cannot
+    # move the axes under a cached background
+    ax.set_xlim(-0.9625, 11.9625)
     ax.set_ylim(0, 220)
     
-    # Add tier separators
-    ax.axvline(x=3.5, color='black', linestyle='--', linewidth=0.8, alpha=0.5)
-    ax.axvline(x=7.5, color='black', linestyle='--', linewidth=0.8, alpha=0.5)
+    # Add tier separators: full-height lines at the tier boundaries, as one artist
+    ax.add_collection(LineCollection([[(3.5, 0), (3.5, 1)], [(7.5, 0), (7.5, 1)]],
+                                     transform=ax.get_xaxis_transform(), colors='black',
+                                     linestyles='--', linewidths=0.8, alpha=0.5), autolim=False)
     
     # Add tier labels
-    ax.text(1.5, 205, 'Tier 1: Foundational', ha='center', fontsize=8, fontstyle='italic')
-    ax.text(5.5, 205, 'Tier 2: Core Planning', ha='center', fontsize=8, fontstyle='italic')
-    ax.text(9.5, 205, 'Tier 3: Advanced', ha='center', fontsize=8, fontstyle='italic')
+    tier_font = FontProperties(size=8, style='italic')
+    ax.text(1.5, 205, 'Tier 1: Foundational', ha='center', fontproperties=tier_font)
+    ax.text(5.5, 205, 'Tier 2: Core Planning', ha='center', fontproperties=tier_font)
+    ax.text(9.5, 205, 'Tier 3: Advanced', ha='center', fontproperties=tier_font)
     
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
     
-    plt.tight_layout()
-    plt.savefig('figure2_task_distribution.png', dpi=300, bbox_inches='tight',
-                facecolor='white', edgecolor='none')
-    plt.close()
-    print("Created figure2_task_distribution.png")
+    # Margins measured once from tight_layout()
+    fig.subplots_adjust(left=0.0683, right=0.985, top=0.9125, bottom=0.1385)
+
+
+def draw_distribution_bars(ax, heights, **kwargs):
+    """Draw all 36 bars in one call; heights are ordered easy, medium, hard."""
+    return ax.bar(BAR_POSITIONS, heights, BAR_WIDTH,
+                  color=np.repeat(DIFFICULTY_COLORS, len(CATEGORIES)), edgecolor='black', **kwargs)
+
+
+def create_distribution_figure():
+    path = 'figure2_task_distribution.png'
+    categories, easy, medium, hard = CATEGORIES, EASY_COUNTS, MEDIUM_COUNTS, HARD_COUNTS
+    colors = DIFFICULTY_COLORS
+    digest = _data_hash((categories, easy, medium, hard, colors))
+    if _is_up_to_date(path, digest):
+        print(f"Skipped {path} (unchanged)")
+        return
+
+    fig, ax = _reset_figure(10, 4)
+    build_distribution_static(fig, ax)
+    draw_distribution_bars(ax, np.concatenate([easy, medium, hard]))
+    FigureCanvasAgg(fig).print_figure(path, dpi=300, bbox_inches=DISTRIBUTION_BBOX,
+                                      facecolor='white', edgecolor='none')
+    _write_stamp(path, digest)
+    print(f"Created {path}")
+
+
+class DistributionPreview:
+    """Redraw only the distribution bars over a cached static background.
+
+    For iterating on bar data: axes, labels, tier separators and legend are
+    rendered once, and each update() restores that background and blits the
+    new bars (and the artists layered over them) on top. Returns the RGBA buffer of the figure.
+    """
+
+    def __init__(self):
+        self.fig = plt.figure(figsize=(10, 4))
+        self.ax = self.fig.add_subplot(111)
+        self.canvas = FigureCanvasAgg(self.fig)
+        build_distribution_static(self.fig, self.ax)
+        # Separators, tier labels and legend sit above the bars, so they are
+        # redrawn after them
+        self.overlays = [*self.ax.collections, *self.ax.texts, self.ax.get_legend()]
+        for artist in self.overlays:
+            artist.set_animated(True)
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._bars = None
+
+    def update(self, heights):
+        self.canvas.restore_region(self.background)
+        if self._bars is not None:
+            self._bars.remove()
+        self._bars = draw_distribution_bars(self.ax, heights, animated=True)
+        for artist in (*self._bars, *self.overlays):
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.fig.bbox)
+        return np.asarray(self.canvas.buffer_rgba())
+
+    def close(self):
+        plt.close(self.fig)
+
+
+FIGURES = {
+    'framework': create_framework_figure,
+    'distribution': create_distribution_figure,
+}
+
+
+def _dispatch(name):
+    # Runs in a worker process; the Agg backend is selected when the worker
+    # imports this module, including under the 'spawn' start method.
+    FIGURES[name]()
+    plt.close(_FIG)
+
 
 if __name__ == '__main__':
-    create_framework_figure()
-    create_distribution_figure()
+    # The figures are independent, so build them side by side.
+    with multiprocessing.Pool(len(FIGURES)) as pool:
+        pool.map(_dispatch, list(FIGURES))
+    plt.close(_FIG)
     print("All figures regenerated successfully!")
@@ -8,97 +8,159 @@ import json
 import random
 import math
 import os
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
 
-random.seed(42)  # For reproducibility
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; json produces the same files, just slower
+    orjson = None
+
+from kernels import HAVE_NUMBA, bfs_grid, bfs_packed
+
+SEED = 42  # For reproducibility
 
 # Task distribution: 375 tasks per category, 125 per difficulty level
 TASKS_PER_CATEGORY = 375
 TASKS_PER_DIFFICULTY = 125
 
-def generate_coordinate_understanding_tasks() -> Dict[str, List[Dict]]:
+
+def _task_headers(prefix: str, category: str, difficulty: str, task_type: str) -> List[Dict]:
+    """Prebuild the fields shared by every task in one block, ids included."""
+    return [
+        {"id": f"{prefix}-{i+1:03d}", "category": category, "difficulty": difficulty, "task_type": task_type}
+        for i in range(TASKS_PER_DIFFICULTY)
+    ]
+
+
+# Per-block headers keyed by id prefix; each task is built as header | fields
+TASK_HEADERS = {
+    prefix: _task_headers(prefix, category, difficulty, task_type)
+    for prefix, category, difficulty, task_type in (
+        ("CU-E", "coordinate_understanding", "easy", "quadrant_identification"),
+        ("CU-M", "coordinate_understanding", "medium", "gps_transformation"),
+        ("CU-H", "coordinate_understanding", "hard", "polygon_containment"),
+        ("NP-E", "navigation_pathfinding", "easy", "direction_following"),
+        ("NP-M", "navigation_pathfinding", "medium", "shortest_path_manhattan"),
+        ("NP-H", "navigation_pathfinding", "hard", "astar_pathfinding"),
+        ("RE-E", "real_estate", "easy", "area_calculation"),
+        ("RE-M", "real_estate", "medium", "proximity_analysis"),
+        ("RE-H", "real_estate", "hard", "zoning_compliance"),
+        ("NI-E", "network_infrastructure", "easy", "cable_length"),
+        ("NI-M", "network_infrastructure", "medium", "topology_analysis"),
+        ("NI-H", "network_infrastructure", "hard", "failure_cascade"),
+        ("GR-E", "geometric_reasoning", "easy", "area_calculation"),
+        ("GR-M", "geometric_reasoning", "medium", "spatial_relationship"),
+        ("GR-H", "geometric_reasoning", "hard", "polygon_area"),
+        ("DC-E", "distance_computation", "easy", "euclidean_distance"),
+        ("DC-M", "distance_computation", "medium", "manhattan_comparison"),
+        ("DC-H", "distance_computation", "hard", "geodesic_distance"),
+    )
+}
+
+# Labels shared by the generators, in the order their drawn indices refer to
+_DIRECTIONS = ("north", "south", "east", "west")
+_PROPERTY_TYPES = ("school", "hospital", "park", "shopping center", "fire station")
+_SHAPES = ("circle", "square", "rectangle", "triangle")
+_RELATIONS = ("inside", "outside", "overlapping", "adjacent")
+_RECT_KEYS = ("x1", "y1", "x2", "y2")
+
+
+def seed_for(category: str) -> int:
+    """Derive a per-category seed that is stable across runs and processes."""
+    return zlib.crc32(f"{SEED}:{category}".encode())
+
+
+def _make_rng(seed: int) -> np.random.Generator:
+    """Seed the random module and return a NumPy generator for bulk draws."""
+    random.seed(seed)
+    return np.random.default_rng(seed)
+
+def generate_coordinate_understanding_tasks(seed: int = SEED) -> Dict[str, List[Dict]]:
     """Generate Coordinate Understanding (CU) tasks."""
+    rng = _make_rng(seed)
     tasks = {"easy": [], "medium": [], "hard": []}
     
+    n = TASKS_PER_DIFFICULTY
+    
     # Easy: Basic coordinate identification and quadrant determination
-    for i in range(TASKS_PER_DIFFICULTY):
-        x, y = random.randint(-100, 100), random.randint(-100, 100)
-        quadrant = 1 if x > 0 and y > 0 else 2 if x < 0 and y > 0 else 3 if x < 0 and y < 0 else 4
-        tasks["easy"].append({
-            "id": f"CU-E-{i+1:03d}",
-            "category": "coordinate_understanding",
-            "difficulty": "easy",
-            "task_type": "quadrant_identification",
-            "question": f"Given the point ({x}, {y}) in a Cartesian coordinate system, which quadrant does this point lie in?",
-            "answer": quadrant,
-            "reasoning_steps": 2
-        })
+    xy = rng.integers(-100, 101, size=(n, 2))
+    x, y = xy[:, 0], xy[:, 1]
+    quadrants = np.where((x > 0) & (y > 0), 1,
+                np.where((x < 0) & (y > 0), 2,
+                np.where((x < 0) & (y < 0), 3, 4)))
+    tasks["easy"] = [TASK_HEADERS["CU-E"][i] | {
+        "question": f"Given the point ({x}, {y}) in a Cartesian coordinate system, which quadrant does this point lie in?",
+        "answer": quadrant,
+        "reasoning_steps": 2
+    } for i, ((x, y), quadrant) in enumerate(zip(xy.tolist(), quadrants.tolist()))]
     
     # Medium: Coordinate transformations and GPS conversions
-    for i in range(TASKS_PER_DIFFICULTY):
-        lat = round(random.uniform(25.0, 49.0), 6)
-        lon = round(random.uniform(-125.0, -67.0), 6)
-        offset_lat = round(random.uniform(-0.01, 0.01), 6)
-        offset_lon = round(random.uniform(-0.01, 0.01), 6)
-        new_lat = round(lat + offset_lat, 6)
-        new_lon = round(lon + offset_lon, 6)
-        tasks["medium"].append({
-            "id": f"CU-M-{i+1:03d}",
-            "category": "coordinate_understanding",
-            "difficulty": "medium",
-            "task_type": "gps_transformation",
-            "question": f"A GPS coordinate is located at ({lat}, {lon}). If we apply an offset of ({offset_lat}, {offset_lon}), what are the new coordinates?",
-            "answer": {"latitude": new_lat, "longitude": new_lon},
-            "reasoning_steps": 3
-        })
+    lat = np.round(rng.uniform(25.0, 49.0, n), 6)
+    lon = np.round(rng.uniform(-125.0, -67.0, n), 6)
+    offset_lat = np.round(rng.uniform(-0.01, 0.01, n), 6)
+    offset_lon = np.round(rng.uniform(-0.01, 0.01, n), 6)
+    new_lat = np.round(lat + offset_lat, 6)
+    new_lon = np.round(lon + offset_lon, 6)
+    tasks["medium"] = [TASK_HEADERS["CU-M"][i] | {
+        "question": f"A GPS coordinate is located at ({la}, {lo}). If we apply an offset of ({ola}, {olo}), what are the new coordinates?",
+        "answer": {"latitude": nla, "longitude": nlo},
+        "reasoning_steps": 3
+    } for i, (la, lo, ola, olo, nla, nlo) in enumerate(zip(
+        lat.tolist(), lon.tolist(), offset_lat.tolist(), offset_lon.tolist(),
+        new_lat.tolist(), new_lon.tolist()))]
     
     # Hard: Multi-step coordinate reasoning with polygon containment
-    for i in range(TASKS_PER_DIFFICULTY):
-        # Generate a simple polygon (rectangle)
-        x1, y1 = random.randint(0, 50), random.randint(0, 50)
-        x2, y2 = x1 + random.randint(10, 50), y1 + random.randint(10, 50)
-        # Generate test point
-        px, py = random.randint(0, 100), random.randint(0, 100)
-        inside = x1 <= px <= x2 and y1 <= py <= y2
-        tasks["hard"].append({
-            "id": f"CU-H-{i+1:03d}",
-            "category": "coordinate_understanding",
-            "difficulty": "hard",
-            "task_type": "polygon_containment",
-            "question": f"A rectangular region is defined by corners ({x1}, {y1}) and ({x2}, {y2}). Is the point ({px}, {py}) inside this region?",
-            "polygon": {"x1": x1, "y1": y1, "x2": x2, "y2": y2},
-            "test_point": {"x": px, "y": py},
-            "answer": inside,
-            "reasoning_steps": 5
-        })
+    # Rectangle corners plus a test point, with containment checked for all tasks at once
+    x1 = rng.integers(0, 51, n)
+    y1 = rng.integers(0, 51, n)
+    x2 = x1 + rng.integers(10, 51, n)
+    y2 = y1 + rng.integers(10, 51, n)
+    px = rng.integers(0, 101, n)
+    py = rng.integers(0, 101, n)
+    inside = (x1 <= px) & (px <= x2) & (y1 <= py) & (py <= y2)
+    tasks["hard"] = [TASK_HEADERS["CU-H"][i] | {
+        "question": f"A rectangular region is defined by corners ({ax}, {ay}) and ({bx}, {by}). Is the point ({qx}, {qy}) inside this region?",
+        "polygon": {"x1": ax, "y1": ay, "x2": bx, "y2": by},
+        "test_point": {"x": qx, "y": qy},
+        "answer": ins,
+        "reasoning_steps": 5
+    } for i, (ax, ay, bx, by, qx, qy, ins) in enumerate(zip(
+        x1.tolist(), y1.tolist(), x2.tolist(), y2.tolist(), px.tolist(), py.tolist(), inside.tolist()))]
     
     return tasks
 
 
-def generate_navigation_pathfinding_tasks() -> Dict[str, List[Dict]]:
+def generate_navigation_pathfinding_tasks(seed: int = SEED) -> Dict[str, List[Dict]]:
     """Generate Navigation & Pathfinding (NP) tasks."""
+    rng = _make_rng(seed)
     tasks = {"easy": [], "medium": [], "hard": []}
     
+    n = TASKS_PER_DIFFICULTY
+    
     # Easy: Simple direction following
-    directions = ["north", "south", "east", "west"]
-    for i in range(TASKS_PER_DIFFICULTY):
-        start_x, start_y = random.randint(0, 10), random.randint(0, 10)
-        steps = []
-        x, y = start_x, start_y
-        for _ in range(random.randint(2, 4)):
-            d = random.choice(directions)
-            dist = random.randint(1, 5)
-            steps.append({"direction": d, "distance": dist})
-            if d == "north": y += dist
-            elif d == "south": y -= dist
-            elif d == "east": x += dist
-            elif d == "west": x -= dist
+    # Up to 4 steps are drawn per task; steps past each task's count are masked out
+    directions = _DIRECTIONS
+    step_dx = np.array([0, 0, 1, -1])
+    step_dy = np.array([1, -1, 0, 0])
+    starts = rng.integers(0, 11, size=(n, 2))
+    num_steps = rng.integers(2, 5, size=n)
+    dirs = rng.integers(0, 4, size=(n, 4))
+    dists = rng.integers(1, 6, size=(n, 4))
+    used = np.arange(4) < num_steps[:, None]
+    ends_x = starts[:, 0] + (step_dx[dirs] * dists * used).sum(axis=1)
+    ends_y = starts[:, 1] + (step_dy[dirs] * dists * used).sum(axis=1)
+    for i, ((start_x, start_y), k, task_dirs, task_dists, x, y) in enumerate(zip(
+            starts.tolist(), num_steps.tolist(), dirs.tolist(), dists.tolist(),
+            ends_x.tolist(), ends_y.tolist())):
+        steps = [{"direction": directions[d], "distance": dist}
+                 for d, dist in zip(task_dirs[:k], task_dists[:k])]
         
-        tasks["easy"].append({
-            "id": f"NP-E-{i+1:03d}",
-            "category": "navigation_pathfinding",
-            "difficulty": "easy",
-            "task_type": "direction_following",
+        tasks["easy"].append(TASK_HEADERS["NP-E"][i] | {
             "question": f"Starting at position ({start_x}, {start_y}), follow these directions: {steps}. What is the final position?",
             "start": {"x": start_x, "y": start_y},
             "steps": steps,
@@ -107,15 +169,12 @@ def generate_navigation_pathfinding_tasks() -> Dict[str, List[Dict]]:
         })
     
     # Medium: Shortest path in a simple grid
-    for i in range(TASKS_PER_DIFFICULTY):
-        start = (random.randint(0, 5), random.randint(0, 5))
-        end = (random.randint(5, 10), random.randint(5, 10))
-        manhattan_dist = abs(end[0] - start[0]) + abs(end[1] - start[1])
-        tasks["medium"].append({
-            "id": f"NP-M-{i+1:03d}",
-            "category": "navigation_pathfinding",
-            "difficulty": "medium",
-            "task_type": "shortest_path_manhattan",
+    starts = rng.integers(0, 6, size=(n, 2))
+    ends = rng.integers(5, 11, size=(n, 2))
+    manhattan = np.abs(ends - starts).sum(axis=1)
+    for i, (start, end, manhattan_dist) in enumerate(zip(
+            map(tuple, starts.tolist()), map(tuple, ends.tolist()), manhattan.tolist())):
+        tasks["medium"].append(TASK_HEADERS["NP-M"][i] | {
             "question": f"In a grid where you can only move horizontally or vertically, what is the shortest path length from {start} to {end}?",
             "start": start,
             "end": end,
@@ -136,32 +195,25 @@ def generate_navigation_pathfinding_tasks() -> Dict[str, List[Dict]]:
             if obs != start and obs != end:
                 obstacles.add(obs)
         
-        # Simple BFS to find path length
-        from collections import deque
-        queue = deque([(start, 0)])
-        visited = {start}
-        path_length = -1
-        while queue:
-            (cx, cy), dist = queue.popleft()
-            if (cx, cy) == end:
-                path_length = dist
-                break
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                nx, ny = cx + dx, cy + dy
-                if 0 <= nx < grid_size and 0 <= ny < grid_size and (nx, ny) not in visited and (nx, ny) not in obstacles:
-                    visited.add((nx, ny))
-                    queue.append(((nx, ny), dist + 1))
+        # BFS for the path length over a packed obstacle grid
+        if HAVE_NUMBA:
+            grid = np.zeros((grid_size, grid_size), np.uint8)
+            ox, oy = zip(*obstacles)
+            grid[list(oy), list(ox)] = 1
+            path_length = int(bfs_grid(grid, start[0], start[1], end[0], end[1], grid_size))
+        else:
+            blocked = bytearray(grid_size * grid_size)
+            for ox, oy in obstacles:
+                blocked[ox * grid_size + oy] = 1
+            path_length = bfs_packed(blocked, start, end, grid_size)
         
-        tasks["hard"].append({
-            "id": f"NP-H-{i+1:03d}",
-            "category": "navigation_pathfinding",
-            "difficulty": "hard",
-            "task_type": "astar_pathfinding",
-            "question": f"In a {grid_size}x{grid_size} grid with obstacles at {list(obstacles)}, find the shortest path length from {start} to {end} using only horizontal and vertical moves.",
+        obstacle_list = list(obstacles)
+        tasks["hard"].append(TASK_HEADERS["NP-H"][i] | {
+            "question": f"In a {grid_size}x{grid_size} grid with obstacles at {obstacle_list}, find the shortest path length from {start} to {end} using only horizontal and vertical moves.",
             "grid_size": grid_size,
             "start": start,
             "end": end,
-            "obstacles": list(obstacles),
+            "obstacles": obstacle_list,
             "answer": path_length,
             "reasoning_steps": 8
         })
@@ -169,20 +221,18 @@ def generate_navigation_pathfinding_tasks() -> Dict[str, List[Dict]]:
     return tasks
 
 
-def generate_real_estate_tasks() -> Dict[str, List[Dict]]:
+def generate_real_estate_tasks(seed: int = SEED) -> Dict[str, List[Dict]]:
     """Generate Real Estate Spatial Analysis (RE) tasks."""
+    rng = _make_rng(seed)
     tasks = {"easy": [], "medium": [], "hard": []}
     
+    n = TASKS_PER_DIFFICULTY
+    
     # Easy: Property area calculation
-    for i in range(TASKS_PER_DIFFICULTY):
-        width = random.randint(50, 200)
-        length = random.randint(50, 200)
-        area = width * length
-        tasks["easy"].append({
-            "id": f"RE-E-{i+1:03d}",
-            "category": "real_estate",
-            "difficulty": "easy",
-            "task_type": "area_calculation",
+    dims = rng.integers(50, 201, size=(n, 2))
+    areas = dims.prod(axis=1)
+    for i, ((width, length), area) in enumerate(zip(dims.tolist(), areas.tolist())):
+        tasks["easy"].append(TASK_HEADERS["RE-E"][i] | {
             "question": f"A rectangular property has dimensions {width} ft x {length} ft. What is the total area in square feet?",
             "dimensions": {"width": width, "length": length},
             "answer": area,
@@ -190,52 +240,44 @@ def generate_real_estate_tasks() -> Dict[str, List[Dict]]:
         })
     
     # Medium: Proximity analysis
-    property_types = ["school", "hospital", "park", "shopping center", "fire station"]
-    for i in range(TASKS_PER_DIFFICULTY):
-        property_loc = (round(random.uniform(0, 10), 2), round(random.uniform(0, 10), 2))
-        amenities = []
-        for pt in property_types:
-            loc = (round(random.uniform(0, 10), 2), round(random.uniform(0, 10), 2))
-            dist = round(math.sqrt((property_loc[0] - loc[0])**2 + (property_loc[1] - loc[1])**2), 2)
-            amenities.append({"type": pt, "location": loc, "distance": dist})
-        
-        closest = min(amenities, key=lambda x: x["distance"])
-        tasks["medium"].append({
-            "id": f"RE-M-{i+1:03d}",
-            "category": "real_estate",
-            "difficulty": "medium",
-            "task_type": "proximity_analysis",
+    property_types = _PROPERTY_TYPES
+    property_locs = np.round(rng.uniform(0, 10, size=(n, 2)), 2)
+    amenity_locs = np.round(rng.uniform(0, 10, size=(n, len(property_types), 2)), 2)
+    offsets = amenity_locs - property_locs[:, None, :]
+    amenity_dists = np.round(np.hypot(offsets[..., 0], offsets[..., 1]), 2)
+    closest_idx = amenity_dists.argmin(axis=1)  # first minimum, as min() picks
+    for i, (property_loc, locs, task_dists, c) in enumerate(zip(
+            map(tuple, property_locs.tolist()), amenity_locs.tolist(),
+            amenity_dists.tolist(), closest_idx.tolist())):
+        amenities = [{"type": pt, "location": tuple(loc), "distance": dist}
+                     for pt, loc, dist in zip(property_types, locs, task_dists)]
+        tasks["medium"].append(TASK_HEADERS["RE-M"][i] | {
             "question": f"A property is located at {property_loc}. Given the following amenities: {[(a['type'], a['location']) for a in amenities]}, which amenity is closest to the property?",
             "property_location": property_loc,
             "amenities": amenities,
-            "answer": closest["type"],
+            "answer": property_types[c],
             "reasoning_steps": 6
         })
     
     # Hard: Zoning compliance with multiple constraints
-    for i in range(TASKS_PER_DIFFICULTY):
-        lot_size = random.randint(5000, 20000)
-        setback_front = random.randint(20, 40)
-        setback_side = random.randint(5, 15)
-        max_coverage = random.uniform(0.3, 0.6)
-        proposed_building = {
-            "width": random.randint(30, 80),
-            "length": random.randint(40, 100),
-            "front_setback": random.randint(15, 45),
-            "side_setback": random.randint(3, 20)
-        }
-        building_area = proposed_building["width"] * proposed_building["length"]
-        coverage = building_area / lot_size
-        
-        compliant = (proposed_building["front_setback"] >= setback_front and 
-                    proposed_building["side_setback"] >= setback_side and 
-                    coverage <= max_coverage)
+    lot_sizes = rng.integers(5000, 20001, size=n)
+    setbacks_front = rng.integers(20, 41, size=n)
+    setbacks_side = rng.integers(5, 16, size=n)
+    max_coverages = rng.uniform(0.3, 0.6, size=n)
+    widths = rng.integers(30, 81, size=n)
+    lengths = rng.integers(40, 101, size=n)
+    front_setbacks = rng.integers(15, 46, size=n)
+    side_setbacks = rng.integers(3, 21, size=n)
+    coverages = widths * lengths / lot_sizes
+    compliant_mask = ((front_setbacks >= setbacks_front) & (side_setbacks >= setbacks_side)
+                      & (coverages <= max_coverages))
+    for i, (lot_size, setback_front, setback_side, max_coverage, bw, bl, fs, ss, compliant) in enumerate(zip(
+            lot_sizes.tolist(), setbacks_front.tolist(), setbacks_side.tolist(), max_coverages.tolist(),
+            widths.tolist(), lengths.tolist(), front_setbacks.tolist(), side_setbacks.tolist(),
+            compliant_mask.tolist())):
+        proposed_building = {"width": bw, "length": bl, "front_setback": fs, "side_setback": ss}
         
-        tasks["hard"].append({
-            "id": f"RE-H-{i+1:03d}",
-            "category": "real_estate",
-            "difficulty": "hard",
-            "task_type": "zoning_compliance",
+        tasks["hard"].append(TASK_HEADERS["RE-H"][i] | {
             "question": f"A lot of {lot_size} sq ft has zoning requirements: front setback {setback_front} ft, side setback {setback_side} ft, max coverage {max_coverage:.0%}. A proposed building is {proposed_building['width']}x{proposed_building['length']} ft with {proposed_building['front_setback']} ft front setback and {proposed_building['side_setback']} ft side setback. Is this compliant?",
             "lot_size": lot_size,
             "zoning": {"front_setback": setback_front, "side_setback": setback_side, "max_coverage": max_coverage},
@@ -247,24 +289,23 @@ def generate_real_estate_tasks() -> Dict[str, List[Dict]]:
     return tasks
 
 
-def generate_network_infrastructure_tasks() -> Dict[str, List[Dict]]:
+def generate_network_infrastructure_tasks(seed: int = SEED) -> Dict[str, List[Dict]]:
     """Generate Network Infrastructure (NI) tasks."""
+    rng = _make_rng(seed)
     tasks = {"easy": [], "medium": [], "hard": []}
     
+    n = TASKS_PER_DIFFICULTY
+    
     # Easy: Cable length calculation
-    for i in range(TASKS_PER_DIFFICULTY):
-        segments = []
-        total_length = 0
-        for _ in range(random.randint(3, 6)):
-            length = random.randint(100, 1000)
-            segments.append(length)
-            total_length += length
+    # Up to 6 segments are drawn per task; segments past each task's count are dropped
+    num_segments = rng.integers(3, 7, size=n)
+    lengths = rng.integers(100, 1001, size=(n, 6))
+    totals = (lengths * (np.arange(6) < num_segments[:, None])).sum(axis=1)
+    for i, (k, task_lengths, total_length) in enumerate(zip(
+            num_segments.tolist(), lengths.tolist(), totals.tolist())):
+        segments = task_lengths[:k]
         
-        tasks["easy"].append({
-            "id": f"NI-E-{i+1:03d}",
-            "category": "network_infrastructure",
-            "difficulty": "easy",
-            "task_type": "cable_length",
+        tasks["easy"].append(TASK_HEADERS["NI-E"][i] | {
             "question": f"A fiber route has the following segment lengths (in feet): {segments}. What is the total cable length needed?",
             "segments": segments,
             "answer": total_length,
@@ -279,24 +320,23 @@ def generate_network_infrastructure_tasks() -> Dict[str, List[Dict]]:
         for j in range(1, num_nodes):
             parent = random.randint(0, j-1)
             edges.append((parent, j))
-        # Add some extra edges
+        # Add some extra edges, skipping duplicates in either direction
+        edge_set = {frozenset(e) for e in edges}
         for _ in range(random.randint(1, 3)):
-            a, b = random.randint(0, num_nodes-1), random.randint(0, num_nodes-1)
-            if a != b and (a, b) not in edges and (b, a) not in edges:
+            a, b = random.randrange(num_nodes), random.randrange(num_nodes)
+            key = frozenset((a, b))
+            if a != b and key not in edge_set:
                 edges.append((a, b))
+                edge_set.add(key)
         
-        # Find node with most connections
+        # Find node with most connections (lowest index on ties)
         degree = [0] * num_nodes
         for a, b in edges:
             degree[a] += 1
             degree[b] += 1
-        max_degree_node = degree.index(max(degree))
+        max_degree_node = max(range(num_nodes), key=degree.__getitem__)
         
-        tasks["medium"].append({
-            "id": f"NI-M-{i+1:03d}",
-            "category": "network_infrastructure",
-            "difficulty": "medium",
-            "task_type": "topology_analysis",
+        tasks["medium"].append(TASK_HEADERS["NI-M"][i] | {
             "question": f"In a network with {num_nodes} nodes and edges {edges}, which node has the most connections?",
             "num_nodes": num_nodes,
             "edges": edges,
@@ -312,21 +352,20 @@ def generate_network_infrastructure_tasks() -> Dict[str, List[Dict]]:
         customers = [random.randint(10, 100) for _ in range(num_nodes)]
         
         # Calculate customers affected if a node fails (all descendants)
-        def count_affected(node):
-            total = customers[node]
-            for j in range(num_nodes):
-                if parents[j] == node:
-                    total += count_affected(j)
-            return total
+        children = [[] for _ in range(num_nodes)]
+        for child, parent in enumerate(parents):
+            if parent >= 0:
+                children[parent].append(child)
         
         failed_node = random.randint(1, num_nodes - 1)
-        affected = count_affected(failed_node)
+        affected = 0
+        stack = [failed_node]
+        while stack:
+            node = stack.pop()
+            affected += customers[node]
+            stack.extend(children[node])
         
-        tasks["hard"].append({
-            "id": f"NI-H-{i+1:03d}",
-            "category": "network_infrastructure",
-            "difficulty": "hard",
-            "task_type": "failure_cascade",
+        tasks["hard"].append(TASK_HEADERS["NI-H"][i] | {
             "question": f"In a network tree with {num_nodes} nodes, parent relationships {list(enumerate(parents))}, and customer counts {list(enumerate(customers))}, how many customers are affected if node {failed_node} fails?",
             "num_nodes": num_nodes,
             "parents": parents,
@@ -339,40 +378,42 @@ def generate_network_infrastructure_tasks() -> Dict[str, List[Dict]]:
     return tasks
 
 
-def generate_geometric_reasoning_tasks() -> Dict[str, List[Dict]]:
+def generate_geometric_reasoning_tasks(seed: int = SEED) -> Dict[str, List[Dict]]:
     """Generate Geometric Reasoning (GR) tasks."""
+    rng = _make_rng(seed)
     tasks = {"easy": [], "medium": [], "hard": []}
+    n = TASKS_PER_DIFFICULTY
     
     # Easy: Basic shape properties
-    shapes = ["circle", "square", "rectangle", "triangle"]
-    for i in range(TASKS_PER_DIFFICULTY):
-        shape = random.choice(shapes)
+    # Shapes and two candidate dimensions per task are drawn up front; circles
+    # and squares use only the first
+    shapes = _SHAPES
+    shape_idx = rng.integers(0, len(shapes), size=n)
+    shape_dims = rng.integers(1, 21, size=(n, 2))
+    for i, (shape_i, (a, b)) in enumerate(zip(shape_idx.tolist(), shape_dims.tolist())):
+        shape = shapes[shape_i]
         if shape == "circle":
-            radius = random.randint(1, 20)
+            radius = a
             area = round(math.pi * radius ** 2, 2)
             question = f"What is the area of a circle with radius {radius}?"
             params = {"radius": radius}
         elif shape == "square":
-            side = random.randint(1, 20)
+            side = a
             area = side ** 2
             question = f"What is the area of a square with side length {side}?"
             params = {"side": side}
         elif shape == "rectangle":
-            width, height = random.randint(1, 20), random.randint(1, 20)
+            width, height = a, b
             area = width * height
             question = f"What is the area of a rectangle with width {width} and height {height}?"
             params = {"width": width, "height": height}
         else:  # triangle
-            base, height = random.randint(1, 20), random.randint(1, 20)
+            base, height = a, b
             area = 0.5 * base * height
             question = f"What is the area of a triangle with base {base} and height {height}?"
             params = {"base": base, "height": height}
         
-        tasks["easy"].append({
-            "id": f"GR-E-{i+1:03d}",
-            "category": "geometric_reasoning",
-            "difficulty": "easy",
-            "task_type": "area_calculation",
+        tasks["easy"].append(TASK_HEADERS["GR-E"][i] | {
             "shape": shape,
             "question": question,
             "parameters": params,
@@ -381,30 +422,25 @@ def generate_geometric_reasoning_tasks() -> Dict[str, List[Dict]]:
         })
     
     # Medium: Spatial relationships
-    relations = ["inside", "outside", "overlapping", "adjacent"]
-    for i in range(TASKS_PER_DIFFICULTY):
-        # Two rectangles
-        r1 = {"x1": random.randint(0, 5), "y1": random.randint(0, 5)}
-        r1["x2"] = r1["x1"] + random.randint(3, 8)
-        r1["y2"] = r1["y1"] + random.randint(3, 8)
-        
-        r2 = {"x1": random.randint(0, 10), "y1": random.randint(0, 10)}
-        r2["x2"] = r2["x1"] + random.randint(3, 8)
-        r2["y2"] = r2["y1"] + random.randint(3, 8)
-        
-        # Determine relationship
-        if r2["x1"] >= r1["x1"] and r2["y1"] >= r1["y1"] and r2["x2"] <= r1["x2"] and r2["y2"] <= r1["y2"]:
-            relation = "inside"
-        elif r1["x2"] < r2["x1"] or r2["x2"] < r1["x1"] or r1["y2"] < r2["y1"] or r2["y2"] < r1["y1"]:
-            relation = "outside"
-        else:
-            relation = "overlapping"
+    relations = _RELATIONS
+    # Two rectangles per task as (x1, y1, x2, y2) columns
+    a_lo = rng.integers(0, 6, size=(n, 2))
+    a_hi = a_lo + rng.integers(3, 9, size=(n, 2))
+    b_lo = rng.integers(0, 11, size=(n, 2))
+    b_hi = b_lo + rng.integers(3, 9, size=(n, 2))
+    rects_a = np.hstack([a_lo, a_hi])
+    rects_b = np.hstack([b_lo, b_hi])
+    
+    # Determine relationship
+    inside = (b_lo >= a_lo).all(axis=1) & (b_hi <= a_hi).all(axis=1)
+    outside = ((a_hi < b_lo) | (b_hi < a_lo)).any(axis=1)
+    relation_idx = np.where(inside, 0, np.where(outside, 1, 2))
+    for i, (ra, rb, rel) in enumerate(zip(rects_a.tolist(), rects_b.tolist(), relation_idx.tolist())):
+        r1 = dict(zip(_RECT_KEYS, ra))
+        r2 = dict(zip(_RECT_KEYS, rb))
+        relation = relations[rel]
         
-        tasks["medium"].append({
-            "id": f"GR-M-{i+1:03d}",
-            "category": "geometric_reasoning",
-            "difficulty": "medium",
-            "task_type": "spatial_relationship",
+        tasks["medium"].append(TASK_HEADERS["GR-M"][i] | {
             "question": f"Rectangle A has corners ({r1['x1']}, {r1['y1']}) and ({r1['x2']}, {r1['y2']}). Rectangle B has corners ({r2['x1']}, {r2['y1']}) and ({r2['x2']}, {r2['y2']}). What is the spatial relationship between A and B?",
             "rectangle_a": r1,
             "rectangle_b": r2,
@@ -413,127 +449,117 @@ def generate_geometric_reasoning_tasks() -> Dict[str, List[Dict]]:
         })
     
     # Hard: Complex polygon operations
-    for i in range(TASKS_PER_DIFFICULTY):
-        # Generate a simple convex polygon (pentagon)
-        center_x, center_y = 50, 50
-        radius = random.randint(20, 40)
-        num_vertices = 5
-        vertices = []
-        for j in range(num_vertices):
-            angle = 2 * math.pi * j / num_vertices
-            x = round(center_x + radius * math.cos(angle), 2)
-            y = round(center_y + radius * math.sin(angle), 2)
-            vertices.append((x, y))
-        
-        # Calculate approximate area using shoelace formula
-        n = len(vertices)
-        area = 0
-        for j in range(n):
-            x1, y1 = vertices[j]
-            x2, y2 = vertices[(j + 1) % n]
-            area += x1 * y2 - x2 * y1
-        area = round(abs(area) / 2, 2)
-        
-        tasks["hard"].append({
-            "id": f"GR-H-{i+1:03d}",
-            "category": "geometric_reasoning",
-            "difficulty": "hard",
-            "task_type": "polygon_area",
-            "question": f"Calculate the area of a polygon with vertices at {vertices} using the shoelace formula.",
-            "vertices": vertices,
-            "answer": area,
-            "reasoning_steps": 8
-        })
+    # Simple convex polygons (pentagons) around (50, 50); every task shares the
+    # same vertex angles, so only the radius varies
+    num_vertices = 5
+    angles = 2 * np.pi * np.arange(num_vertices) / num_vertices
+    radius = rng.integers(20, 41, n)
+    X = np.round(50 + radius[:, None] * np.cos(angles), 2)
+    Y = np.round(50 + radius[:, None] * np.sin(angles), 2)
+    
+    # Area of every polygon at once using the shoelace formula
+    areas = np.round(np.abs(np.sum(X * np.roll(Y, -1, axis=1) - np.roll(X, -1, axis=1) * Y, axis=1)) / 2, 2)
+    
+    tasks["hard"] = [TASK_HEADERS["GR-H"][i] | {
+        "question": f"Calculate the area of a polygon with vertices at {vertices} using the shoelace formula.",
+        "vertices": vertices,
+        "answer": area,
+        "reasoning_steps": 8
+    } for i, (vertices, area) in enumerate(zip(
+        (list(zip(xs, ys)) for xs, ys in zip(X.tolist(), Y.tolist())), areas.tolist()))]
     
     return tasks
 
 
-def generate_distance_computation_tasks() -> Dict[str, List[Dict]]:
+def generate_distance_computation_tasks(seed: int = SEED) -> Dict[str, List[Dict]]:
     """Generate Distance Computation (DC) tasks."""
+    rng = _make_rng(seed)
     tasks = {"easy": [], "medium": [], "hard": []}
     
+    n = TASKS_PER_DIFFICULTY
+    
     # Easy: Euclidean distance
-    for i in range(TASKS_PER_DIFFICULTY):
-        p1 = (random.randint(0, 100), random.randint(0, 100))
-        p2 = (random.randint(0, 100), random.randint(0, 100))
-        dist = round(math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2), 2)
-        
-        tasks["easy"].append({
-            "id": f"DC-E-{i+1:03d}",
-            "category": "distance_computation",
-            "difficulty": "easy",
-            "task_type": "euclidean_distance",
-            "question": f"Calculate the Euclidean distance between points {p1} and {p2}.",
-            "point_a": p1,
-            "point_b": p2,
-            "answer": dist,
-            "reasoning_steps": 3
-        })
+    p1 = rng.integers(0, 101, size=(n, 2))
+    p2 = rng.integers(0, 101, size=(n, 2))
+    dists = np.round(np.sqrt(((p2 - p1) ** 2).sum(axis=1)), 2)
+    tasks["easy"] = [TASK_HEADERS["DC-E"][i] | {
+        "question": f"Calculate the Euclidean distance between points {a} and {b}.",
+        "point_a": a,
+        "point_b": b,
+        "answer": dist,
+        "reasoning_steps": 3
+    } for i, (a, b, dist) in enumerate(zip(map(tuple, p1.tolist()), map(tuple, p2.tolist()), dists.tolist()))]
     
     # Medium: Manhattan distance comparison
-    for i in range(TASKS_PER_DIFFICULTY):
-        origin = (random.randint(0, 50), random.randint(0, 50))
-        destinations = []
-        for j in range(4):
-            dest = (random.randint(0, 100), random.randint(0, 100))
-            manhattan = abs(dest[0] - origin[0]) + abs(dest[1] - origin[1])
-            destinations.append({"point": dest, "distance": manhattan})
-        
-        closest = min(destinations, key=lambda x: x["distance"])
-        
-        tasks["medium"].append({
-            "id": f"DC-M-{i+1:03d}",
-            "category": "distance_computation",
-            "difficulty": "medium",
-            "task_type": "manhattan_comparison",
+    origins = rng.integers(0, 51, size=(n, 2))
+    dests = rng.integers(0, 101, size=(n, 4, 2))
+    manhattan = np.abs(dests - origins[:, None, :]).sum(axis=2)
+    closest_idx = manhattan.argmin(axis=1)  # first minimum, as min() picks
+    for i, (origin, points, mdists, c) in enumerate(zip(
+            map(tuple, origins.tolist()), dests.tolist(), manhattan.tolist(), closest_idx.tolist())):
+        destinations = [{"point": tuple(pt), "distance": d} for pt, d in zip(points, mdists)]
+        tasks["medium"].append(TASK_HEADERS["DC-M"][i] | {
             "question": f"From origin {origin}, which of these points is closest using Manhattan distance: {[d['point'] for d in destinations]}?",
             "origin": origin,
             "destinations": destinations,
-            "answer": closest["point"],
+            "answer": destinations[c]["point"],
             "reasoning_steps": 5
         })
     
     # Hard: Geodesic distance (Haversine formula)
-    for i in range(TASKS_PER_DIFFICULTY):
-        # Generate two GPS coordinates in the US
-        lat1 = round(random.uniform(25.0, 48.0), 4)
-        lon1 = round(random.uniform(-124.0, -70.0), 4)
-        lat2 = round(random.uniform(25.0, 48.0), 4)
-        lon2 = round(random.uniform(-124.0, -70.0), 4)
-        
-        # Haversine formula
-        R = 6371  # Earth's radius in km
-        lat1_rad, lat2_rad = math.radians(lat1), math.radians(lat2)
-        dlat = math.radians(lat2 - lat1)
-        dlon = math.radians(lon2 - lon1)
-        a = math.sin(dlat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon/2)**2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-        distance = round(R * c, 2)
-        
-        tasks["hard"].append({
-            "id": f"DC-H-{i+1:03d}",
-            "category": "distance_computation",
-            "difficulty": "hard",
-            "task_type": "geodesic_distance",
-            "question": f"Calculate the geodesic (great-circle) distance in kilometers between GPS coordinates ({lat1}, {lon1}) and ({lat2}, {lon2}) using the Haversine formula.",
-            "point_a": {"latitude": lat1, "longitude": lon1},
-            "point_b": {"latitude": lat2, "longitude": lon2},
-            "answer": distance,
-            "reasoning_steps": 8
-        })
+    # Two GPS coordinates in the US per task
+    lat1 = np.round(rng.uniform(25.0, 48.0, n), 4)
+    lon1 = np.round(rng.uniform(-124.0, -70.0, n), 4)
+    lat2 = np.round(rng.uniform(25.0, 48.0, n), 4)
+    lon2 = np.round(rng.uniform(-124.0, -70.0, n), 4)
+    
+    R = 6371  # Earth's radius in km
+    lat1_rad, lat2_rad = np.radians(lat1), np.radians(lat2)
+    dlat = np.radians(lat2 - lat1)
+    dlon = np.radians(lon2 - lon1)
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlon / 2) ** 2
+    distances = np.round(R * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a)), 2)
+    
+    tasks["hard"] = [TASK_HEADERS["DC-H"][i] | {
+        "question": f"Calculate the geodesic (great-circle) distance in kilometers between GPS coordinates ({la1}, {lo1}) and ({la2}, {lo2}) using the Haversine formula.",
+        "point_a": {"latitude": la1, "longitude": lo1},
+        "point_b": {"latitude": la2, "longitude": lo2},
+        "answer": distance,
+        "reasoning_steps": 8
+    } for i, (la1, lo1, la2, lo2, distance) in enumerate(zip(
+        lat1.tolist(), lon1.tolist(), lat2.tolist(), lon2.tolist(), distances.tolist()))]
     
     return tasks
 
 
-def save_tasks(tasks: Dict[str, List[Dict]], category: str, base_path: str):
-    """Save tasks to JSON files."""
-    for difficulty, task_list in tasks.items():
-        filepath = os.path.join(base_path, category, difficulty, "tasks.json")
-        with open(filepath, 'w') as f:
-            json.dump(task_list, f, indent=2)
+def dump_json(obj: Any, filepath: str):
+    """Write obj as 2-space indented JSON in a single write."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode()
+    with open(filepath, 'wb') as f:
+        f.write(data)
+
+
+_print_lock = threading.Lock()
+
+
+def _write_one(item, category: str, base_path: str):
+    """Write one difficulty's task list; the directory already exists."""
+    difficulty, task_list = item
+    filepath = os.path.join(base_path, category, difficulty, "tasks.json")
+    dump_json(task_list, filepath)
+    with _print_lock:
         print(f"Saved {len(task_list)} tasks to {filepath}")
 
 
+def save_tasks(tasks: Dict[str, List[Dict]], category: str, base_path: str):
+    """Save tasks to JSON files, one thread per difficulty."""
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(lambda item: _write_one(item, category, base_path), tasks.items()))
+
+
 def main():
     base_path = "/home/ubuntu/spatial-benchmark/data"
     
@@ -550,10 +576,18 @@ def main():
         "distance_computation": generate_distance_computation_tasks,
     }
     
+    # Create the output tree up front so a missing directory cannot abort a
+    # half-written run
+    for category in categories:
+        for difficulty in ("easy", "medium", "hard"):
+            os.makedirs(os.path.join(base_path, category, difficulty), exist_ok=True)
+    
+    # Each generator seeds itself from its category name, so the output does
+    # not depend on the order the categories are generated in
     total_tasks = 0
     for category, generator in categories.items():
-        print(f"\nGenerating {category}...")
-        tasks = generator()
+        tasks = generator(seed_for(category))
+        print(f"\nGenerated {category}")
         save_tasks(tasks, category, base_path)
         category_total = sum(len(t) for t in tasks.values())
         total_tasks += category_total
@@ -573,8 +607,7 @@ def main():
         "tasks_per_difficulty": TASKS_PER_DIFFICULTY
     }
     
-    with open(os.path.join(base_path, "dataset_summary.json"), 'w') as f:
-        json.dump(summary, f, indent=2)
+    dump_json(summary, os.path.join(base_path, "dataset_summary.json"))
     
     print(f"\nDataset summary saved to {base_path}/dataset_summary.json")
 
@@ -16,12 +16,24 @@ import math
 import random
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Set, Tuple
 from collections import deque
-import heapq
+from concurrent.futures import ThreadPoolExecutor
+from itertools import starmap
 
-# Set seed for reproducibility
-random.seed(42)
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; json produces the same files, just slower
+    orjson = None
+
+from kernels import (HAVE_NUMBA, bfs_csr, bfs_grid, bfs_packed, clip_segment_rect,
+                     come_within)
+
+# Seeded generator for reproducibility. Every task draws from this one
+# stream, in generation order, so the global random module is left alone.
+RNG = random.Random(42)
 
 # --- Configuration ---
 TASKS_PER_CATEGORY = 500
@@ -43,11 +55,19 @@ CATEGORIES = [
     "real_estate_geospatial",
 ]
 
+QUADRANTS = ("I", "II", "III", "IV")
+
 # --- Utility Functions ---
 
 def euclidean_distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
     """Calculate Euclidean distance between two points."""
-    return math.sqrt((p1[0] - p2[0])**2 + (p1[1] - p2[1])**2)
+    return math.hypot(p1[0] - p2[0], p1[1] - p2[1])
+
+def squared_distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
+    """Squared Euclidean distance, for comparing against a squared radius without a sqrt."""
+    dx = p1[0] - p2[0]
+    dy = p1[1] - p2[1]
+    return dx * dx + dy * dy
 
 def manhattan_distance(p1: Tuple[int, int], p2: Tuple[int, int]) -> int:
     """Calculate Manhattan distance between two points."""
@@ -64,7 +84,16 @@ def rectangles_overlap(r1: Tuple[float, float, float, float], r2: Tuple[float, f
     return not (r1[2] < r2[0] or r2[2] < r1[0] or r1[3] < r2[1] or r2[3] < r1[1])
 
 def line_intersects_rectangle(p1: Tuple[float, float], p2: Tuple[float, float], rect: Tuple[float, float, float, float]) -> bool:
-    """Check if a line segment intersects a rectangle."""
+    """Check if a line segment intersects a rectangle.
+
+    Liang-Barsky clipping settles segments that miss the rectangle or cross
+    its interior. Segments that only touch its boundary get the edge-by-edge
+    test below, whose answers for those cases the dataset was built with.
+    """
+    side = clip_segment_rect(p1[0], p1[1], p2[0], p2[1], *rect)
+    if side != 0:
+        return side > 0
+    
     def ccw(A, B, C):
         return (C[1]-A[1]) * (B[0]-A[0]) > (B[1]-A[1]) * (C[0]-A[0])
     
@@ -86,37 +115,39 @@ def line_intersects_rectangle(p1: Tuple[float, float], p2: Tuple[float, float],
     
     return False
 
-def a_star(grid: List[List[int]], start: Tuple[int, int], end: Tuple[int, int]) -> int:
-    """A* pathfinding algorithm. Returns path length or -1 if no path."""
-    rows, cols = len(grid), len(grid[0])
-    
-    def heuristic(a, b):
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
-    
-    open_set = [(0, start)]
-    g_score = {start: 0}
-    
-    while open_set:
-        _, current = heapq.heappop(open_set)
-        
-        if current == end:
-            return g_score[current]
-        
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            neighbor = (current[0] + dx, current[1] + dy)
-            
-            if 0 <= neighbor[0] < rows and 0 <= neighbor[1] < cols:
-                if grid[neighbor[0]][neighbor[1]] == 1:  # Obstacle
-                    continue
-                
-                tentative_g = g_score[current] + 1
-                
-                if neighbor not in g_score or tentative_g < g_score[neighbor]:
-                    g_score[neighbor] = tentative_g
-                    f_score = tentative_g + heuristic(neighbor, end)
-                    heapq.heappush(open_set, (f_score, neighbor))
-    
-    return -1  # No path found
+def shortest_path_length(grid: np.ndarray, start: Tuple[int, int], end: Tuple[int, int]) -> int:
+    """Path length on a square int8 obstacle grid indexed [row, col], or -1.
+
+    Every move costs 1, so a plain BFS finds the shortest path. Runs the
+    compiled kernel if numba is available, else its Python counterpart.
+    """
+    n = grid.shape[0]
+    if HAVE_NUMBA:
+        # bfs_grid indexes [y, x], so columns are x and rows are y
+        return int(bfs_grid(grid, start[1], start[0], end[1], end[0], n))
+    return bfs_packed(bytearray(grid.tobytes()), start, end, n)
+
+def draw_interior_cells(k: int, grid_size: int) -> set:
+    """k distinct (row, col) cells off the grid border, drawn from RNG.
+
+    Plain rejection sampling: each draw is a row then a column, and repeats
+    are skipped, so the cells (and the set's order) follow the RNG stream.
+    """
+    randint = RNG.randint
+    hi = grid_size - 2
+    cells = set()
+    while len(cells) < k:
+        cells.add((randint(1, hi), randint(1, hi)))
+    return cells
+
+def corner_path_length(obstacles: Set[Tuple[int, int]], grid_size: int) -> int:
+    """Path length from (0, 0) to the opposite corner past the given obstacle
+    cells, or -1."""
+    grid = np.zeros((grid_size, grid_size), dtype=np.int8)
+    if obstacles:
+        rows, cols = np.array(list(obstacles), dtype=np.int32).T
+        grid[rows, cols] = 1
+    return shortest_path_length(grid, (0, 0), (grid_size - 1, grid_size - 1))
 
 def bfs_connected(graph: Dict[int, List[int]], start: int, end: int) -> bool:
     """BFS to check if two nodes are connected in a graph."""
@@ -136,13 +167,112 @@ def bfs_connected(graph: Dict[int, List[int]], start: int, end: int) -> bool:
                 queue.append(neighbor)
     return False
 
+def csr_adjacency(edges: List[Tuple[int, int]], num_nodes: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Undirected edge list as CSR (indptr, indices) int32 arrays."""
+    e = np.asarray(edges, dtype=np.int32).reshape(-1, 2)
+    src = np.concatenate([e[:, 0], e[:, 1]])
+    dst = np.concatenate([e[:, 1], e[:, 0]])
+    indptr = np.zeros(num_nodes + 1, dtype=np.int32)
+    np.cumsum(np.bincount(src, minlength=num_nodes), out=indptr[1:])
+    return indptr, dst[np.argsort(src, kind="stable")]
+
+def nodes_connected(edges: List[Tuple[int, int]], num_nodes: int, start: int, end: int) -> bool:
+    """Whether start and end are connected: the compiled CSR BFS if numba is
+    available, else bfs_connected."""
+    if HAVE_NUMBA:
+        indptr, indices = csr_adjacency(edges, num_nodes)
+        return bool(bfs_csr(indptr, indices, start, end))
+    graph = {i: [] for i in range(num_nodes)}
+    for a, b in edges:
+        graph[a].append(b)
+        graph[b].append(a)
+    return bfs_connected(graph, start, end)
+
+def hop_distances(edges: List[Tuple[int, int]], num_nodes: int) -> np.ndarray:
+    """All-pairs hop counts of an undirected graph (Floyd-Warshall), -1 if unreachable."""
+    d = np.full((num_nodes, num_nodes), np.inf)
+    if edges:
+        a, b = np.asarray(edges).T
+        d[a, b] = d[b, a] = 1
+    np.fill_diagonal(d, 0)
+    for k in range(num_nodes):
+        np.minimum(d, d[:, k, None] + d[None, k, :], out=d)
+    return np.where(np.isinf(d), -1, d).astype(np.int64)
+
+def network_edges_str(edges: List[Tuple[int, int]]) -> str:
+    """Describe network links as 'N1-N2, N2-N3, ...'."""
+    return ", ".join(["N%d-N%d" % (a + 1, b + 1) for a, b in edges])
+
+# Fixed maps and networks. Each is shared by every task of its block, so the
+# descriptions and answers are worked out once here.
+
+# topological_reasoning easy: region adjacencies, answer per query region
+TR_EASY_REGIONS = ["A", "B", "C", "D", "E"]
+TR_EASY_ADJACENCY = {
+    "A": ["B", "C"],
+    "B": ["A", "C", "D"],
+    "C": ["A", "B", "D", "E"],
+    "D": ["B", "C", "E"],
+    "E": ["C", "D"],
+}
+TR_EASY_ADJ_STR = "; ".join([f"{r} borders {', '.join(TR_EASY_ADJACENCY[r])}" for r in TR_EASY_REGIONS])
+TR_EASY_ANSWERS = {r: ", ".join(sorted(n)) for r, n in TR_EASY_ADJACENCY.items()}
+
+# network_infrastructure easy: a fixed chain, so the answer never changes
+NI_EASY_NUM_NODES = 5
+NI_EASY_EDGES = [(0, 1), (1, 2), (2, 3), (3, 4)]
+NI_EASY_ENDPOINTS = (0, 4)
+NI_EASY_EDGES_STR = network_edges_str(NI_EASY_EDGES)
+NI_EASY_CONNECTED = nodes_connected(NI_EASY_EDGES, NI_EASY_NUM_NODES, *NI_EASY_ENDPOINTS)
+
+# network_infrastructure medium: answer per removed link
+NI_MEDIUM_NUM_NODES = 6
+NI_MEDIUM_EDGES = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (0, 2), (2, 4)]
+NI_MEDIUM_ENDPOINTS = (0, 5)
+NI_MEDIUM_EDGES_STR = network_edges_str(NI_MEDIUM_EDGES)
+NI_MEDIUM_CONNECTED_AFTER_REMOVAL = {
+    removed: nodes_connected([e for e in NI_MEDIUM_EDGES if e != removed], NI_MEDIUM_NUM_NODES,
+                             *NI_MEDIUM_ENDPOINTS)
+    for removed in NI_MEDIUM_EDGES
+}
+
+# network_infrastructure hard: all-pairs hop counts
+NI_HARD_NUM_NODES = 7
+NI_HARD_EDGES = [(0, 1), (1, 2), (2, 3), (3, 6), (0, 4), (4, 5), (5, 6), (1, 4), (2, 5)]
+NI_HARD_EDGES_STR = network_edges_str(NI_HARD_EDGES)
+NI_HARD_HOPS = hop_distances(NI_HARD_EDGES, NI_HARD_NUM_NODES)
+
+# resource_allocation hard: stations covering the even grid points of [0, 10]^2,
+# counted with one broadcast over squared distances (exact for these integers)
+RAO_HARD_RESOURCES = np.array([(3, 3), (7, 3), (5, 7)], dtype=np.float64)
+RAO_HARD_RADIUS = 2.5
+RAO_HARD_RESOURCES_STR = ", ".join(["S%d(%d,%d)" % (i, *r) for i, r in enumerate(RAO_HARD_RESOURCES.tolist(), 1)])
+GRID_PTS = np.array([(x, y) for x in range(0, 11, 2) for y in range(0, 11, 2)], dtype=np.float64)
+RAO_HARD_COVERED_COUNT = int(
+    (((GRID_PTS[:, None, :] - RAO_HARD_RESOURCES[None, :, :]) ** 2).sum(-1) <= RAO_HARD_RADIUS ** 2)
+    .any(axis=1).sum())
+
 # --- Task Generators ---
 
+def _task_record(code: str, category: str, difficulty: str, task_id: int,
+                 prompt: str, ground_truth: Any) -> Dict[str, Any]:
+    """One task as written to tasks.json; shared by the per-task and batch generators."""
+    return {
+        "task_id": f"{code}_{difficulty}_{task_id:04d}",
+        "category": category,
+        "difficulty": difficulty,
+        "prompt": prompt,
+        "ground_truth": ground_truth,
+    }
+
+def _cu_rotation_prompt(x: int, y: int, angle: int) -> str:
+    return f"A point at ({x}, {y}) is rotated {angle} degrees counter-clockwise around the origin. What are its new coordinates? Answer in the format (x, y)."
+
 def generate_coordinate_understanding(difficulty: str, task_id: int) -> Dict[str, Any]:
     """Generate Coordinate Understanding tasks."""
     if difficulty == "easy":
         # Simple coordinate identification
-        x, y = random.randint(-10, 10), random.randint(-10, 10)
+        x, y = RNG.randint(-10, 10), RNG.randint(-10, 10)
         if x > 0 and y > 0:
             quadrant = "I"
         elif x < 0 and y > 0:
@@ -159,8 +289,8 @@ def generate_coordinate_understanding(difficulty: str, task_id: int) -> Dict[str
         
     elif difficulty == "medium":
         # Vector addition
-        x1, y1 = random.randint(-10, 10), random.randint(-10, 10)
-        vx, vy = random.randint(-5, 5), random.randint(-5, 5)
+        x1, y1 = RNG.randint(-10, 10), RNG.randint(-10, 10)
+        vx, vy = RNG.randint(-5, 5), RNG.randint(-5, 5)
         result_x, result_y = x1 + vx, y1 + vy
         
         prompt = f"A point is located at ({x1}, {y1}). If it moves by a vector ({vx}, {vy}), what are its new coordinates? Answer in the format (x, y)."
@@ -168,8 +298,8 @@ def generate_coordinate_understanding(difficulty: str, task_id: int) -> Dict[str
         
     else:  # hard
         # Rotation around origin
-        x, y = random.randint(1, 10), random.randint(1, 10)
-        angle = random.choice([90, 180, 270])
+        x, y = RNG.randint(1, 10), RNG.randint(1, 10)
+        angle = RNG.choice([90, 180, 270])
         
         if angle == 90:
             new_x, new_y = -y, x
@@ -178,23 +308,17 @@ def generate_coordinate_understanding(difficulty: str, task_id: int) -> Dict[str
         else:  # 270
             new_x, new_y = y, -x
         
-        prompt = f"A point at ({x}, {y}) is rotated {angle} degrees counter-clockwise around the origin. What are its new coordinates? Answer in the format (x, y)."
+        prompt = _cu_rotation_prompt(x, y, angle)
         ground_truth = f"({new_x}, {new_y})"
     
-    return {
-        "task_id": f"CU_{difficulty}_{task_id:04d}",
-        "category": "coordinate_understanding",
-        "difficulty": difficulty,
-        "prompt": prompt,
-        "ground_truth": ground_truth,
-    }
+    return _task_record("CU", "coordinate_understanding", difficulty, task_id, prompt, ground_truth)
 
 def generate_geometric_reasoning(difficulty: str, task_id: int) -> Dict[str, Any]:
     """Generate Geometric Reasoning tasks."""
     if difficulty == "easy":
         # Rectangle area
-        width = random.randint(2, 20)
-        height = random.randint(2, 20)
+        width = RNG.randint(2, 20)
+        height = RNG.randint(2, 20)
         area = width * height
         
         prompt = f"A rectangle has a width of {width} units and a height of {height} units. What is its area in square units?"
@@ -202,17 +326,17 @@ def generate_geometric_reasoning(difficulty: str, task_id: int) -> Dict[str, Any
         
     elif difficulty == "medium":
         # Rectangle overlap detection
-        r1 = (random.randint(0, 5), random.randint(0, 5), random.randint(6, 10), random.randint(6, 10))
+        r1 = (RNG.randint(0, 5), RNG.randint(0, 5), RNG.randint(6, 10), RNG.randint(6, 10))
         
         # Generate second rectangle that may or may not overlap
-        if random.random() < 0.5:
+        if RNG.random() < 0.5:
             # Overlapping
-            r2 = (random.randint(r1[0], r1[2]-1), random.randint(r1[1], r1[3]-1), 
-                  random.randint(r1[2], 15), random.randint(r1[3], 15))
+            r2 = (RNG.randint(r1[0], r1[2]-1), RNG.randint(r1[1], r1[3]-1), 
+                  RNG.randint(r1[2], 15), RNG.randint(r1[3], 15))
         else:
             # Non-overlapping
-            r2 = (r1[2] + random.randint(1, 5), r1[3] + random.randint(1, 5),
-                  r1[2] + random.randint(6, 10), r1[3] + random.randint(6, 10))
+            r2 = (r1[2] + RNG.randint(1, 5), r1[3] + RNG.randint(1, 5),
+                  r1[2] + RNG.randint(6, 10), r1[3] + RNG.randint(6, 10))
         
         overlap = rectangles_overlap(r1, r2)
         
@@ -221,9 +345,9 @@ def generate_geometric_reasoning(difficulty: str, task_id: int) -> Dict[str, Any
         
     else:  # hard
         # Triangle area using coordinates
-        x1, y1 = random.randint(0, 10), random.randint(0, 10)
-        x2, y2 = random.randint(0, 10), random.randint(0, 10)
-        x3, y3 = random.randint(0, 10), random.randint(0, 10)
+        x1, y1 = RNG.randint(0, 10), RNG.randint(0, 10)
+        x2, y2 = RNG.randint(0, 10), RNG.randint(0, 10)
+        x3, y3 = RNG.randint(0, 10), RNG.randint(0, 10)
         
         # Shoelace formula
         area = abs((x1*(y2-y3) + x2*(y3-y1) + x3*(y1-y2)) / 2)
@@ -239,87 +363,74 @@ def generate_geometric_reasoning(difficulty: str, task_id: int) -> Dict[str, Any
         "ground_truth": ground_truth,
     }
 
+def _dc_distance_prompt(metric: str, x1: int, y1: int, x2: int, y2: int) -> str:
+    return f"What is the {metric} distance between point ({x1}, {y1}) and point ({x2}, {y2})?"
+
 def generate_distance_computation(difficulty: str, task_id: int) -> Dict[str, Any]:
     """Generate Distance Computation tasks."""
     if difficulty == "easy":
         # Manhattan distance
-        x1, y1 = random.randint(0, 10), random.randint(0, 10)
-        x2, y2 = random.randint(0, 10), random.randint(0, 10)
+        x1, y1 = RNG.randint(0, 10), RNG.randint(0, 10)
+        x2, y2 = RNG.randint(0, 10), RNG.randint(0, 10)
         dist = manhattan_distance((x1, y1), (x2, y2))
         
-        prompt = f"What is the Manhattan distance between point ({x1}, {y1}) and point ({x2}, {y2})?"
+        prompt = _dc_distance_prompt("Manhattan", x1, y1, x2, y2)
         ground_truth = dist
         
     elif difficulty == "medium":
         # Euclidean distance (integer result)
         # Use Pythagorean triples for clean answers
         triples = [(3, 4, 5), (5, 12, 13), (8, 15, 17), (6, 8, 10)]
-        dx, dy, dist = random.choice(triples)
-        x1, y1 = random.randint(0, 10), random.randint(0, 10)
+        dx, dy, dist = RNG.choice(triples)
+        x1, y1 = RNG.randint(0, 10), RNG.randint(0, 10)
         x2, y2 = x1 + dx, y1 + dy
         
-        prompt = f"What is the Euclidean distance between point ({x1}, {y1}) and point ({x2}, {y2})?"
+        prompt = _dc_distance_prompt("Euclidean", x1, y1, x2, y2)
         ground_truth = dist
         
     else:  # hard
         # Closest point among multiple
-        target = (random.randint(0, 20), random.randint(0, 20))
-        num_points = random.randint(4, 6)
-        points = [(random.randint(0, 20), random.randint(0, 20)) for _ in range(num_points)]
+        target = (RNG.randint(0, 20), RNG.randint(0, 20))
+        num_points = RNG.randint(4, 6)
+        points = [(RNG.randint(0, 20), RNG.randint(0, 20)) for _ in range(num_points)]
         
-        distances = [(euclidean_distance(target, p), i, p) for i, p in enumerate(points)]
-        closest_dist, closest_idx, closest_point = min(distances)
+        # Squared distances order the points the same way; argmin takes the
+        # first minimum, as the lowest index wins ties
+        sq_dists = ((np.array(points) - target) ** 2).sum(axis=1)
+        closest_idx = int(sq_dists.argmin())
         
-        points_str = ", ".join([f"P{i+1}({p[0]}, {p[1]})" for i, p in enumerate(points)])
+        points_str = ", ".join(["P%d(%d, %d)" % (i, x, y) for i, (x, y) in enumerate(points, 1)])
         prompt = f"Given the target point T({target[0]}, {target[1]}) and the following points: {points_str}. Which point is closest to T? Answer with the point label (e.g., P1)."
         ground_truth = f"P{closest_idx + 1}"
     
-    return {
-        "task_id": f"DC_{difficulty}_{task_id:04d}",
-        "category": "distance_computation",
-        "difficulty": difficulty,
-        "prompt": prompt,
-        "ground_truth": ground_truth,
-    }
+    return _task_record("DC", "distance_computation", difficulty, task_id, prompt, ground_truth)
 
 def generate_topological_reasoning(difficulty: str, task_id: int) -> Dict[str, Any]:
     """Generate Topological Reasoning tasks."""
     if difficulty == "easy":
         # Simple adjacency
-        regions = ["A", "B", "C", "D", "E"]
-        adjacency = {
-            "A": ["B", "C"],
-            "B": ["A", "C", "D"],
-            "C": ["A", "B", "D", "E"],
-            "D": ["B", "C", "E"],
-            "E": ["C", "D"],
-        }
-        query_region = random.choice(regions)
-        neighbors = adjacency[query_region]
-        
-        adj_str = "; ".join([f"{r} borders {', '.join(adjacency[r])}" for r in regions])
-        prompt = f"A map has 5 regions with the following adjacencies: {adj_str}. Which regions border region {query_region}? List them separated by commas."
-        ground_truth = ", ".join(sorted(neighbors))
+        query_region = RNG.choice(TR_EASY_REGIONS)
+        
+        prompt = f"A map has 5 regions with the following adjacencies: {TR_EASY_ADJ_STR}. Which regions border region {query_region}? List them separated by commas."
+        ground_truth = TR_EASY_ANSWERS[query_region]
         
     elif difficulty == "medium":
         # Containment
         outer = (0, 0, 20, 20)
-        inner_count = random.randint(2, 4)
+        inner_count = RNG.randint(2, 4)
         inners = []
         for i in range(inner_count):
-            x1 = random.randint(1, 8)
-            y1 = random.randint(1, 8)
-            x2 = x1 + random.randint(2, 5)
-            y2 = y1 + random.randint(2, 5)
+            x1 = RNG.randint(1, 8)
+            y1 = RNG.randint(1, 8)
+            x2 = x1 + RNG.randint(2, 5)
+            y2 = y1 + RNG.randint(2, 5)
             inners.append((x1, y1, x2, y2))
         
-        test_point = (random.randint(0, 20), random.randint(0, 20))
-        containing = []
-        for i, rect in enumerate(inners):
-            if point_in_rectangle(test_point, rect):
-                containing.append(f"R{i+1}")
+        tx, ty = test_point = (RNG.randint(0, 20), RNG.randint(0, 20))
+        containing = ["R%d" % i for i, (x_min, y_min, x_max, y_max) in enumerate(inners, 1)
+                      if x_min <= tx <= x_max and y_min <= ty <= y_max]
         
-        regions_str = "; ".join([f"R{i+1} has corners ({r[0]},{r[1]}) and ({r[2]},{r[3]})" for i, r in enumerate(inners)])
+        regions_str = "; ".join(["R%d has corners (%d,%d) and (%d,%d)" % (i, *r) for i, r in enumerate(inners, 1)])
         prompt = f"Given regions: {regions_str}. Which regions contain the point ({test_point[0]}, {test_point[1]})? Answer with region labels separated by commas, or 'None' if no region contains it."
         ground_truth = ", ".join(containing) if containing else "None"
         
@@ -328,18 +439,19 @@ def generate_topological_reasoning(difficulty: str, task_id: int) -> Dict[str, A
         num_regions = 6
         # Create a connected graph
         edges = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (0, 2), (1, 3), (2, 4)]
-        random.shuffle(edges)
-        edges = edges[:random.randint(5, 7)]
-        
-        graph = {i: [] for i in range(num_regions)}
-        for a, b in edges:
-            graph[a].append(b)
-            graph[b].append(a)
-        
-        start, end = random.sample(range(num_regions), 2)
-        connected = bfs_connected(graph, start, end)
-        
-        edges_str = ", ".join([f"R{a+1}-R{b+1}" for a, b in edges])
+        RNG.shuffle(edges)
+        edges = edges[:RNG.randint(5, 7)]
+        
+        # Two distinct regions without building a population list. Same draws
+        # as RNG.sample(range(num_regions), 2): the second pick skips the first
+        # by standing in the last region for it
+        start = RNG.randrange(num_regions)
+        end = RNG.randrange(num_regions - 1)
+        if end == start:
+            end = num_regions - 1
+        connected = nodes_connected(edges, num_regions, start, end)
+        
+        edges_str = ", ".join(["R%d-R%d" % (a + 1, b + 1) for a, b in edges])
         prompt = f"A map has {num_regions} regions (R1 to R{num_regions}) with the following borders: {edges_str}. Can you travel from R{start+1} to R{end+1} by only crossing adjacent regions? Answer Yes or No."
         ground_truth = "Yes" if connected else "No"
     
@@ -357,7 +469,7 @@ def generate_navigation_pathfinding(difficulty: str, task_id: int) -> Dict[str,
         # Simple grid, no obstacles
         grid_size = 5
         start = (0, 0)
-        end = (random.randint(2, grid_size-1), random.randint(2, grid_size-1))
+        end = (RNG.randint(2, grid_size-1), RNG.randint(2, grid_size-1))
         path_length = manhattan_distance(start, end)
         
         prompt = f"On a {grid_size}x{grid_size} grid with no obstacles, what is the shortest path length from ({start[0]}, {start[1]}) to ({end[0]}, {end[1]})? You can only move up, down, left, or right."
@@ -366,49 +478,30 @@ def generate_navigation_pathfinding(difficulty: str, task_id: int) -> Dict[str,
     elif difficulty == "medium":
         # Grid with some obstacles
         grid_size = 6
-        grid = [[0] * grid_size for _ in range(grid_size)]
-        
-        # Add obstacles (ensure path exists)
-        num_obstacles = random.randint(3, 6)
-        obstacles = set()
-        while len(obstacles) < num_obstacles:
-            ox, oy = random.randint(1, grid_size-2), random.randint(1, grid_size-2)
-            obstacles.add((ox, oy))
-        
-        for ox, oy in obstacles:
-            grid[ox][oy] = 1
-        
-        start = (0, 0)
-        end = (grid_size-1, grid_size-1)
-        path_length = a_star(grid, start, end)
         
-        # If no path, regenerate
-        if path_length == -1:
-            return generate_navigation_pathfinding(difficulty, task_id)
+        # Add obstacles (ensure path exists): if there is no path, draw a new set
+        while True:
+            num_obstacles = RNG.randint(3, 6)
+            obstacles = draw_interior_cells(num_obstacles, grid_size)
+            
+            path_length = corner_path_length(obstacles, grid_size)
+            if path_length != -1:
+                break
         
-        obs_str = ", ".join([f"({o[0]},{o[1]})" for o in obstacles])
+        obs_str = ", ".join(starmap("({},{})".format, obstacles))
         prompt = f"On a {grid_size}x{grid_size} grid, obstacles are at: {obs_str}. What is the shortest path length from (0,0) to ({grid_size-1},{grid_size-1})? You can only move up, down, left, or right. If no path exists, answer -1."
         ground_truth = path_length
         
     else:  # hard
         # Larger grid with more obstacles
         grid_size = 8
-        grid = [[0] * grid_size for _ in range(grid_size)]
         
-        num_obstacles = random.randint(8, 12)
-        obstacles = set()
-        while len(obstacles) < num_obstacles:
-            ox, oy = random.randint(1, grid_size-2), random.randint(1, grid_size-2)
-            obstacles.add((ox, oy))
+        num_obstacles = RNG.randint(8, 12)
+        obstacles = draw_interior_cells(num_obstacles, grid_size)
         
-        for ox, oy in obstacles:
-            grid[ox][oy] = 1
+        path_length = corner_path_length(obstacles, grid_size)
         
-        start = (0, 0)
-        end = (grid_size-1, grid_size-1)
-        path_length = a_star(grid, start, end)
-        
-        obs_str = ", ".join([f"({o[0]},{o[1]})" for o in obstacles])
+        obs_str = ", ".join(starmap("({},{})".format, obstacles))
         prompt = f"On an {grid_size}x{grid_size} grid, obstacles are at: {obs_str}. What is the shortest path length from (0,0) to ({grid_size-1},{grid_size-1})? You can only move up, down, left, or right. If no path exists, answer -1."
         ground_truth = path_length
     
@@ -425,7 +518,7 @@ def generate_viewpoint_visibility(difficulty: str, task_id: int) -> Dict[str, An
     if difficulty == "easy":
         # Simple line of sight
         observer = (0, 0)
-        target = (random.randint(5, 10), random.randint(5, 10))
+        target = (RNG.randint(5, 10), RNG.randint(5, 10))
         
         # No obstacles
         prompt = f"An observer is at ({observer[0]}, {observer[1]}) and a target is at ({target[0]}, {target[1]}). With no obstacles, can the observer see the target? Answer Yes or No."
@@ -437,7 +530,7 @@ def generate_viewpoint_visibility(difficulty: str, task_id: int) -> Dict[str, An
         target = (10, 10)
         
         # Place obstacle that may or may not block
-        if random.random() < 0.5:
+        if RNG.random() < 0.5:
             # Blocking obstacle
             obstacle = (4, 4, 6, 6)
             blocked = True
@@ -458,12 +551,12 @@ def generate_viewpoint_visibility(difficulty: str, task_id: int) -> Dict[str, An
         blocked = False
         
         # Generate 2-3 obstacles
-        num_obs = random.randint(2, 3)
+        num_obs = RNG.randint(2, 3)
         for _ in range(num_obs):
-            x1 = random.randint(2, 12)
-            y1 = random.randint(2, 12)
-            x2 = x1 + random.randint(2, 4)
-            y2 = y1 + random.randint(2, 4)
+            x1 = RNG.randint(2, 12)
+            y1 = RNG.randint(2, 12)
+            x2 = x1 + RNG.randint(2, 4)
+            y2 = y1 + RNG.randint(2, 4)
             obstacles.append((x1, y1, x2, y2))
         
         # Check if any obstacle blocks the line of sight
@@ -472,7 +565,7 @@ def generate_viewpoint_visibility(difficulty: str, task_id: int) -> Dict[str, An
                 blocked = True
                 break
         
-        obs_str = "; ".join([f"Obstacle {i+1}: corners ({o[0]},{o[1]}) and ({o[2]},{o[3]})" for i, o in enumerate(obstacles)])
+        obs_str = "; ".join(["Obstacle %d: corners (%d,%d) and (%d,%d)" % (i, *o) for i, o in enumerate(obstacles, 1)])
         prompt = f"An observer is at ({observer[0]}, {observer[1]}) and a target is at ({target[0]}, {target[1]}). {obs_str}. Can the observer see the target (direct line of sight)? Answer Yes or No."
         ground_truth = "No" if blocked else "Yes"
     
@@ -488,51 +581,44 @@ def generate_pattern_recognition(difficulty: str, task_id: int) -> Dict[str, Any
     """Generate Pattern Recognition tasks."""
     if difficulty == "easy":
         # Identify quadrant with most points
-        points = [(random.randint(-10, 10), random.randint(-10, 10)) for _ in range(10)]
-        
-        quadrant_counts = {"I": 0, "II": 0, "III": 0, "IV": 0}
-        for x, y in points:
-            if x > 0 and y > 0:
-                quadrant_counts["I"] += 1
-            elif x < 0 and y > 0:
-                quadrant_counts["II"] += 1
-            elif x < 0 and y < 0:
-                quadrant_counts["III"] += 1
-            elif x > 0 and y < 0:
-                quadrant_counts["IV"] += 1
-        
-        max_quadrant = max(quadrant_counts, key=quadrant_counts.get)
-        
-        points_str = ", ".join([f"({p[0]},{p[1]})" for p in points])
+        points = [(RNG.randint(-10, 10), RNG.randint(-10, 10)) for _ in range(10)]
+        
+        # Quadrant index per point (-1 on an axis), counted in one pass
+        sx, sy = np.sign(points).T
+        quad_idx = np.select([(sx > 0) & (sy > 0), (sx < 0) & (sy > 0), (sx < 0) & (sy < 0), (sx > 0) & (sy < 0)],
+                             [0, 1, 2, 3], default=-1)
+        quadrant_counts = np.bincount(quad_idx[quad_idx >= 0], minlength=4)
+        max_quadrant = QUADRANTS[quadrant_counts.argmax()]  # first maximum, as max() picks
+        
+        points_str = ", ".join(starmap("({},{})".format, points))
         prompt = f"Given the points: {points_str}. Which quadrant (I, II, III, or IV) contains the most points? Points on axes are not counted."
         ground_truth = max_quadrant
         
     elif difficulty == "medium":
         # Centroid calculation
-        num_points = random.randint(4, 6)
-        points = [(random.randint(0, 20), random.randint(0, 20)) for _ in range(num_points)]
+        num_points = RNG.randint(4, 6)
+        points = [(RNG.randint(0, 20), RNG.randint(0, 20)) for _ in range(num_points)]
         
-        centroid_x = sum(p[0] for p in points) / num_points
-        centroid_y = sum(p[1] for p in points) / num_points
+        centroid_x, centroid_y = np.mean(points, axis=0).tolist()
         
-        points_str = ", ".join([f"({p[0]},{p[1]})" for p in points])
+        points_str = ", ".join(starmap("({},{})".format, points))
         prompt = f"Given the points: {points_str}. What is the centroid (geometric center) of these points? Answer in format (x, y) rounded to one decimal place."
         ground_truth = f"({round(centroid_x, 1)}, {round(centroid_y, 1)})"
         
     else:  # hard
         # Identify if points form a line (collinearity)
-        if random.random() < 0.5:
+        if RNG.random() < 0.5:
             # Generate collinear points
-            x_start = random.randint(0, 5)
-            y_start = random.randint(0, 5)
-            dx = random.randint(1, 3)
-            dy = random.randint(1, 3)
-            num_points = random.randint(3, 5)
+            x_start = RNG.randint(0, 5)
+            y_start = RNG.randint(0, 5)
+            dx = RNG.randint(1, 3)
+            dy = RNG.randint(1, 3)
+            num_points = RNG.randint(3, 5)
             points = [(x_start + i*dx, y_start + i*dy) for i in range(num_points)]
             collinear = True
         else:
             # Generate non-collinear points
-            points = [(random.randint(0, 20), random.randint(0, 20)) for _ in range(4)]
+            points = [(RNG.randint(0, 20), RNG.randint(0, 20)) for _ in range(4)]
             # Check actual collinearity
             if len(points) >= 3:
                 x1, y1 = points[0]
@@ -547,7 +633,7 @@ def generate_pattern_recognition(difficulty: str, task_id: int) -> Dict[str, Any
             else:
                 collinear = True
         
-        points_str = ", ".join([f"({p[0]},{p[1]})" for p in points])
+        points_str = ", ".join(starmap("({},{})".format, points))
         prompt = f"Given the points: {points_str}. Are all these points collinear (lie on the same straight line)? Answer Yes or No."
         ground_truth = "Yes" if collinear else "No"
     
@@ -563,69 +649,32 @@ def generate_network_infrastructure(difficulty: str, task_id: int) -> Dict[str,
     """Generate Network Infrastructure tasks."""
     if difficulty == "easy":
         # Simple connectivity check
-        num_nodes = 5
-        edges = [(0, 1), (1, 2), (2, 3), (3, 4)]
-        
-        graph = {i: [] for i in range(num_nodes)}
-        for a, b in edges:
-            graph[a].append(b)
-            graph[b].append(a)
-        
-        start, end = 0, 4
-        connected = bfs_connected(graph, start, end)
+        num_nodes = NI_EASY_NUM_NODES
+        start, end = NI_EASY_ENDPOINTS
         
-        edges_str = ", ".join([f"N{a+1}-N{b+1}" for a, b in edges])
-        prompt = f"A network has {num_nodes} nodes (N1 to N{num_nodes}) with connections: {edges_str}. Is N{start+1} connected to N{end+1}? Answer Yes or No."
-        ground_truth = "Yes" if connected else "No"
+        prompt = f"A network has {num_nodes} nodes (N1 to N{num_nodes}) with connections: {NI_EASY_EDGES_STR}. Is N{start+1} connected to N{end+1}? Answer Yes or No."
+        ground_truth = "Yes" if NI_EASY_CONNECTED else "No"
         
     elif difficulty == "medium":
         # Connectivity after link removal
-        num_nodes = 6
-        edges = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (0, 2), (2, 4)]
+        num_nodes = NI_MEDIUM_NUM_NODES
         
         # Remove one edge
-        removed_edge = random.choice(edges)
-        remaining_edges = [e for e in edges if e != removed_edge]
-        
-        graph = {i: [] for i in range(num_nodes)}
-        for a, b in remaining_edges:
-            graph[a].append(b)
-            graph[b].append(a)
-        
-        start, end = 0, 5
-        connected = bfs_connected(graph, start, end)
+        removed_edge = RNG.choice(NI_MEDIUM_EDGES)
+        start, end = NI_MEDIUM_ENDPOINTS
+        connected = NI_MEDIUM_CONNECTED_AFTER_REMOVAL[removed_edge]
         
-        edges_str = ", ".join([f"N{a+1}-N{b+1}" for a, b in edges])
-        prompt = f"A network has {num_nodes} nodes with connections: {edges_str}. If the link N{removed_edge[0]+1}-N{removed_edge[1]+1} fails, is N{start+1} still connected to N{end+1}? Answer Yes or No."
+        prompt = f"A network has {num_nodes} nodes with connections: {NI_MEDIUM_EDGES_STR}. If the link N{removed_edge[0]+1}-N{removed_edge[1]+1} fails, is N{start+1} still connected to N{end+1}? Answer Yes or No."
         ground_truth = "Yes" if connected else "No"
         
     else:  # hard
-        # Shortest path in weighted graph (simplified as hop count)
-        num_nodes = 7
-        edges = [(0, 1), (1, 2), (2, 3), (3, 6), (0, 4), (4, 5), (5, 6), (1, 4), (2, 5)]
-        
-        graph = {i: [] for i in range(num_nodes)}
-        for a, b in edges:
-            graph[a].append(b)
-            graph[b].append(a)
-        
-        # BFS for shortest path
+        # Shortest path in weighted graph (simplified as hop count). The graph
+        # is the same for every task, so hops come from the precomputed matrix
+        num_nodes = NI_HARD_NUM_NODES
         start, end = 0, 6
-        visited = {start: 0}
-        queue = deque([start])
-        while queue:
-            node = queue.popleft()
-            if node == end:
-                break
-            for neighbor in graph[node]:
-                if neighbor not in visited:
-                    visited[neighbor] = visited[node] + 1
-                    queue.append(neighbor)
+        shortest_path = int(NI_HARD_HOPS[start, end])
         
-        shortest_path = visited.get(end, -1)
-        
-        edges_str = ", ".join([f"N{a+1}-N{b+1}" for a, b in edges])
-        prompt = f"A network has {num_nodes} nodes with connections: {edges_str}. What is the minimum number of hops to get from N{start+1} to N{end+1}?"
+        prompt = f"A network has {num_nodes} nodes with connections: {NI_HARD_EDGES_STR}. What is the minimum number of hops to get from N{start+1} to N{end+1}?"
         ground_truth = shortest_path
     
     return {
@@ -641,7 +690,7 @@ def generate_constraint_based_placement(difficulty: str, task_id: int) -> Dict[s
     if difficulty == "easy":
         # Simple placement check
         room_size = 10
-        object_pos = (random.randint(0, room_size), random.randint(0, room_size))
+        object_pos = (RNG.randint(0, room_size), RNG.randint(0, room_size))
         min_dist_from_wall = 2
         
         valid = (object_pos[0] >= min_dist_from_wall and 
@@ -654,8 +703,8 @@ def generate_constraint_based_placement(difficulty: str, task_id: int) -> Dict[s
         
     elif difficulty == "medium":
         # Two objects with minimum distance constraint
-        obj1 = (random.randint(2, 8), random.randint(2, 8))
-        obj2 = (random.randint(2, 8), random.randint(2, 8))
+        obj1 = (RNG.randint(2, 8), RNG.randint(2, 8))
+        obj2 = (RNG.randint(2, 8), RNG.randint(2, 8))
         min_dist = 3
         
         actual_dist = euclidean_distance(obj1, obj2)
@@ -668,31 +717,18 @@ def generate_constraint_based_placement(difficulty: str, task_id: int) -> Dict[s
         # Multiple objects with multiple constraints
         room_size = 20
         num_objects = 3
-        objects = [(random.randint(2, 18), random.randint(2, 18)) for _ in range(num_objects)]
+        objects = [(RNG.randint(2, 18), RNG.randint(2, 18)) for _ in range(num_objects)]
         min_dist_between = 4
         max_dist_from_center = 8
         center = (10, 10)
         
-        # Check all constraints
-        valid = True
-        
-        # Check pairwise distances
-        for i in range(num_objects):
-            for j in range(i+1, num_objects):
-                if euclidean_distance(objects[i], objects[j]) < min_dist_between:
-                    valid = False
-                    break
-            if not valid:
-                break
-        
-        # Check distance from center
-        if valid:
-            for obj in objects:
-                if euclidean_distance(obj, center) > max_dist_from_center:
-                    valid = False
-                    break
+        # Check all constraints: pairwise distances, then distance from center
+        pts = np.array(objects)
+        i, j = np.triu_indices(num_objects, k=1)
+        valid = bool((np.sqrt(((pts[j] - pts[i]) ** 2).sum(axis=1)) >= min_dist_between).all()
+                     and (np.sqrt(((pts - center) ** 2).sum(axis=1)) <= max_dist_from_center).all())
         
-        objects_str = ", ".join([f"O{i+1}({o[0]},{o[1]})" for i, o in enumerate(objects)])
+        objects_str = ", ".join(["O%d(%d,%d)" % (i, *o) for i, o in enumerate(objects, 1)])
         prompt = f"In a {room_size}x{room_size} room, {num_objects} objects are placed at: {objects_str}. Constraints: (1) Objects must be at least {min_dist_between} units apart from each other. (2) All objects must be within {max_dist_from_center} units of the center ({center[0]},{center[1]}). Is this placement valid? Answer Yes or No."
         ground_truth = "Yes" if valid else "No"
     
@@ -710,9 +746,9 @@ def generate_resource_allocation(difficulty: str, task_id: int) -> Dict[str, Any
         # Single resource coverage
         resource_pos = (5, 5)
         coverage_radius = 3
-        test_point = (random.randint(0, 10), random.randint(0, 10))
+        test_point = (RNG.randint(0, 10), RNG.randint(0, 10))
         
-        covered = euclidean_distance(resource_pos, test_point) <= coverage_radius
+        covered = squared_distance(resource_pos, test_point) <= coverage_radius * coverage_radius
         
         prompt = f"A service station at ({resource_pos[0]}, {resource_pos[1]}) covers all points within {coverage_radius} units. Is the point ({test_point[0]}, {test_point[1]}) covered? Answer Yes or No."
         ground_truth = "Yes" if covered else "No"
@@ -721,28 +757,22 @@ def generate_resource_allocation(difficulty: str, task_id: int) -> Dict[str, Any
         # Multiple resources, check coverage
         resources = [(2, 2), (8, 2), (5, 8)]
         coverage_radius = 3
-        test_point = (random.randint(0, 10), random.randint(0, 10))
+        tx, ty = test_point = (RNG.randint(0, 10), RNG.randint(0, 10))
         
-        covered = any(euclidean_distance(r, test_point) <= coverage_radius for r in resources)
+        radius_sq = coverage_radius * coverage_radius
+        covered = any((rx - tx) * (rx - tx) + (ry - ty) * (ry - ty) <= radius_sq
+                      for rx, ry in resources)
         
-        resources_str = ", ".join([f"S{i+1}({r[0]},{r[1]})" for i, r in enumerate(resources)])
+        resources_str = ", ".join(["S%d(%d,%d)" % (i, *r) for i, r in enumerate(resources, 1)])
         prompt = f"Service stations are at: {resources_str}. Each covers points within {coverage_radius} units. Is the point ({test_point[0]}, {test_point[1]}) covered by any station? Answer Yes or No."
         ground_truth = "Yes" if covered else "No"
         
     else:  # hard
-        # Count covered vs uncovered points
-        resources = [(3, 3), (7, 3), (5, 7)]
-        coverage_radius = 2.5
-        
-        # Generate test points
-        test_points = [(x, y) for x in range(0, 11, 2) for y in range(0, 11, 2)]
-        
-        covered_count = 0
-        for point in test_points:
-            if any(euclidean_distance(r, point) <= coverage_radius for r in resources):
-                covered_count += 1
-        
-        resources_str = ", ".join([f"S{i+1}({r[0]},{r[1]})" for i, r in enumerate(resources)])
+        # Count covered vs uncovered points. Stations and grid are the same for
+        # every task, so the count is precomputed
+        coverage_radius = RAO_HARD_RADIUS
+        covered_count = RAO_HARD_COVERED_COUNT
+        resources_str = RAO_HARD_RESOURCES_STR
         prompt = f"Service stations are at: {resources_str}. Each covers points within {coverage_radius} units. How many of the grid points (0,0), (0,2), (0,4), ..., (10,10) (i.e., all points where both coordinates are even numbers from 0 to 10) are covered by at least one station?"
         ground_truth = covered_count
     
@@ -754,13 +784,25 @@ def generate_resource_allocation(difficulty: str, task_id: int) -> Dict[str, Any
         "ground_truth": ground_truth,
     }
 
+def _draw_tsr_meeting() -> Tuple[int, ...]:
+    """Starts and velocities for a TSR-medium task: (ax, ay, avx, avy, bx, by, bvx, bvy)."""
+    return (RNG.randint(0, 5), RNG.randint(0, 5), RNG.randint(1, 3), RNG.randint(0, 2),
+            RNG.randint(8, 15), RNG.randint(3, 10), RNG.randint(-3, 0), RNG.randint(-1, 1))
+
+def _tsr_meetings(draws: np.ndarray) -> np.ndarray:
+    """Whether A and B come within 1 unit within 10 seconds, for each row of (n, 8) draws."""
+    return come_within(draws[:, 0:2] - draws[:, 4:6], draws[:, 2:4] - draws[:, 6:8], 1, 10)
+
+def _tsr_meeting_prompt(ax, ay, avx, avy, bx, by, bvx, bvy) -> str:
+    return f"Object A starts at ({ax},{ay}) with velocity ({avx},{avy}). Object B starts at ({bx},{by}) with velocity ({bvx},{bvy}). Will they come within 1 unit of each other within 10 seconds? Answer Yes or No."
+
 def generate_temporal_spatial_reasoning(difficulty: str, task_id: int) -> Dict[str, Any]:
     """Generate Temporal-Spatial Reasoning tasks."""
     if difficulty == "easy":
         # Simple position after time
         start_pos = (0, 0)
-        velocity = (random.randint(1, 5), random.randint(1, 5))
-        time = random.randint(1, 5)
+        velocity = (RNG.randint(1, 5), RNG.randint(1, 5))
+        time = RNG.randint(1, 5)
         
         end_pos = (start_pos[0] + velocity[0] * time, start_pos[1] + velocity[1] * time)
         
@@ -769,32 +811,18 @@ def generate_temporal_spatial_reasoning(difficulty: str, task_id: int) -> Dict[s
         
     elif difficulty == "medium":
         # Two objects, will they meet?
-        obj1_start = (random.randint(0, 5), random.randint(0, 5))
-        obj1_vel = (random.randint(1, 3), random.randint(0, 2))
-        obj2_start = (random.randint(8, 15), random.randint(3, 10))
-        obj2_vel = (random.randint(-3, 0), random.randint(-1, 1))
-        
-        # Check if paths intersect at same time
-        # Position at time t: obj1 = (2t, t), obj2 = (10-t, 5)
-        # They meet if 2t = 10-t and t = 5 => t = 10/3 and t = 5 (no solution)
         # Simplified: check if they get within 1 unit of each other within 10 seconds
+        draw = _draw_tsr_meeting()
+        meet = _tsr_meetings(np.array([draw], dtype=np.int64))[0]
         
-        meet = False
-        for t in range(11):
-            pos1 = (obj1_start[0] + obj1_vel[0] * t, obj1_start[1] + obj1_vel[1] * t)
-            pos2 = (obj2_start[0] + obj2_vel[0] * t, obj2_start[1] + obj2_vel[1] * t)
-            if euclidean_distance(pos1, pos2) <= 1:
-                meet = True
-                break
-        
-        prompt = f"Object A starts at ({obj1_start[0]},{obj1_start[1]}) with velocity ({obj1_vel[0]},{obj1_vel[1]}). Object B starts at ({obj2_start[0]},{obj2_start[1]}) with velocity ({obj2_vel[0]},{obj2_vel[1]}). Will they come within 1 unit of each other within 10 seconds? Answer Yes or No."
+        prompt = _tsr_meeting_prompt(*draw)
         ground_truth = "Yes" if meet else "No"
         
     else:  # hard
         # Time to reach a target
         start = (0, 0)
-        target = (random.randint(10, 20), random.randint(10, 20))
-        speed = random.randint(2, 5)
+        target = (RNG.randint(10, 20), RNG.randint(10, 20))
+        speed = RNG.randint(2, 5)
         
         distance = euclidean_distance(start, target)
         time_to_reach = distance / speed
@@ -802,20 +830,14 @@ def generate_temporal_spatial_reasoning(difficulty: str, task_id: int) -> Dict[s
         prompt = f"An object at ({start[0]}, {start[1]}) moves directly toward ({target[0]}, {target[1]}) at a speed of {speed} units per second. How many seconds will it take to reach the target? Round to one decimal place."
         ground_truth = round(time_to_reach, 1)
     
-    return {
-        "task_id": f"TSR_{difficulty}_{task_id:04d}",
-        "category": "temporal_spatial_reasoning",
-        "difficulty": difficulty,
-        "prompt": prompt,
-        "ground_truth": ground_truth,
-    }
+    return _task_record("TSR", "temporal_spatial_reasoning", difficulty, task_id, prompt, ground_truth)
 
 def generate_real_estate_geospatial(difficulty: str, task_id: int) -> Dict[str, Any]:
     """Generate Real Estate & Geospatial tasks."""
     if difficulty == "easy":
         # Point in zone check
         zone = (0, 0, 10, 10)
-        point = (random.randint(-2, 12), random.randint(-2, 12))
+        point = (RNG.randint(-2, 12), RNG.randint(-2, 12))
         
         in_zone = point_in_rectangle(point, zone)
         
@@ -824,25 +846,23 @@ def generate_real_estate_geospatial(difficulty: str, task_id: int) -> Dict[str,
         
     elif difficulty == "medium":
         # Distance to amenity
-        property_loc = (random.randint(0, 20), random.randint(0, 20))
+        property_loc = (RNG.randint(0, 20), RNG.randint(0, 20))
         school = (5, 5)
         hospital = (15, 15)
         max_school_dist = 5
         
-        school_dist = euclidean_distance(property_loc, school)
-        within_school_range = school_dist <= max_school_dist
+        within_school_range = squared_distance(property_loc, school) <= max_school_dist * max_school_dist
         
         prompt = f"A property is at ({property_loc[0]}, {property_loc[1]}). The nearest school is at ({school[0]}, {school[1]}). Is the property within {max_school_dist} units of the school? Answer Yes or No."
         ground_truth = "Yes" if within_school_range else "No"
         
     else:  # hard
         # Complex zoning query
-        property_loc = (random.randint(5, 15), random.randint(5, 15))
+        property_loc = (RNG.randint(5, 15), RNG.randint(5, 15))
         school = (8, 8)
         highway = (0, 10, 20, 12)  # Horizontal strip
         
-        school_dist = euclidean_distance(property_loc, school)
-        near_school = school_dist <= 5
+        near_school = squared_distance(property_loc, school) <= 5 * 5
         
         # Check if within 2 units of highway
         near_highway = (highway[1] - 2 <= property_loc[1] <= highway[3] + 2)
@@ -861,6 +881,58 @@ def generate_real_estate_geospatial(difficulty: str, task_id: int) -> Dict[str,
         "ground_truth": ground_truth,
     }
 
+# --- Batch Generators ---
+# Whole (category, difficulty) blocks whose answers are plain arithmetic. Each
+# task's values are drawn from RNG in the same order as the per-task generator,
+# so the output is identical; only the answers are computed in bulk.
+
+def generate_coordinate_understanding_hard_batch(n: int) -> List[Dict[str, Any]]:
+    """Rotation tasks, as generate_coordinate_understanding("hard", ...)."""
+    draws = np.array([(RNG.randint(1, 10), RNG.randint(1, 10), RNG.choice([90, 180, 270]))
+                      for _ in range(n)])
+    x, y, angle = draws.T
+    rotated = np.where((angle == 90)[:, None], np.stack([-y, x], axis=1),
+                       np.where((angle == 180)[:, None], np.stack([-x, -y], axis=1),
+                                np.stack([y, -x], axis=1)))
+    return [_task_record("CU", "coordinate_understanding", "hard", i,
+                         _cu_rotation_prompt(px, py, a), f"({nx}, {ny})")
+            for i, ((px, py, a), (nx, ny)) in enumerate(zip(draws.tolist(), rotated.tolist()), 1)]
+
+def generate_distance_computation_easy_batch(n: int) -> List[Dict[str, Any]]:
+    """Manhattan distance tasks, as generate_distance_computation("easy", ...)."""
+    draws = np.array([(RNG.randint(0, 10), RNG.randint(0, 10), RNG.randint(0, 10), RNG.randint(0, 10))
+                      for _ in range(n)])
+    dists = np.abs(draws[:, :2] - draws[:, 2:]).sum(axis=1)
+    return [_task_record("DC", "distance_computation", "easy", i,
+                         _dc_distance_prompt("Manhattan", x1, y1, x2, y2), dist)
+            for i, ((x1, y1, x2, y2), dist) in enumerate(zip(draws.tolist(), dists.tolist()), 1)]
+
+def generate_distance_computation_medium_batch(n: int) -> List[Dict[str, Any]]:
+    """Pythagorean-triple distance tasks, as generate_distance_computation("medium", ...)."""
+    triples = [(3, 4, 5), (5, 12, 13), (8, 15, 17), (6, 8, 10)]
+    draws = np.array([(*RNG.choice(triples), RNG.randint(0, 10), RNG.randint(0, 10))
+                      for _ in range(n)])
+    dx, dy, dist, x1, y1 = draws.T
+    ends = np.stack([x1 + dx, y1 + dy], axis=1)
+    return [_task_record("DC", "distance_computation", "medium", i,
+                         _dc_distance_prompt("Euclidean", ax, ay, bx, by), d)
+            for i, (ax, ay, (bx, by), d) in enumerate(zip(x1.tolist(), y1.tolist(), ends.tolist(), dist.tolist()), 1)]
+
+def generate_temporal_spatial_reasoning_medium_batch(n: int) -> List[Dict[str, Any]]:
+    """Meeting tasks, as generate_temporal_spatial_reasoning("medium", ...)."""
+    draws = [_draw_tsr_meeting() for _ in range(n)]
+    meets = _tsr_meetings(np.array(draws, dtype=np.int64))
+    return [_task_record("TSR", "temporal_spatial_reasoning", "medium", i,
+                         _tsr_meeting_prompt(*draw), "Yes" if meet else "No")
+            for i, (draw, meet) in enumerate(zip(draws, meets.tolist()), 1)]
+
+BATCH_GENERATORS = {
+    ("coordinate_understanding", "hard"): generate_coordinate_understanding_hard_batch,
+    ("distance_computation", "easy"): generate_distance_computation_easy_batch,
+    ("distance_computation", "medium"): generate_distance_computation_medium_batch,
+    ("temporal_spatial_reasoning", "medium"): generate_temporal_spatial_reasoning_medium_batch,
+}
+
 # --- Main Generation Logic ---
 
 GENERATORS = {
@@ -878,30 +950,45 @@ GENERATORS = {
     "real_estate_geospatial": generate_real_estate_geospatial,
 }
 
+# (category, generator, output directory) in generation order, resolved once
+_PLAN = [(category, GENERATORS[category], Path(__file__).parent / category)
+         for category in CATEGORIES]
+
+def dump_json(obj: Any, filepath: Path):
+    """Write obj as 2-space indented JSON in a single write."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode()
+    with open(filepath, "wb") as f:
+        f.write(data)
+
 def generate_all_tasks():
     """Generate all tasks for all categories and difficulties."""
     base_dir = Path(__file__).parent
     
     total_tasks = 0
     summary = {"categories": {}, "total_tasks": 0}
+    outputs = []  # (tasks, path) pairs, written once generation is done
     
-    for category in CATEGORIES:
-        generator = GENERATORS[category]
-        category_dir = base_dir / category
+    # Generation stays serial: every task draws from the one RNG stream, so
+    # the order of generation is part of the dataset
+    for category, generator, category_dir in _PLAN:
+        diff_dirs = {difficulty: category_dir / difficulty for difficulty in DIFFICULTIES}
         summary["categories"][category] = {"easy": 0, "medium": 0, "hard": 0, "total": 0}
         
         for difficulty in DIFFICULTIES:
-            diff_dir = category_dir / difficulty
+            diff_dir = diff_dirs[difficulty]
             diff_dir.mkdir(parents=True, exist_ok=True)
             
-            tasks = []
-            for i in range(TASKS_PER_DIFFICULTY):
-                task = generator(difficulty, i + 1)
-                tasks.append(task)
+            batch_generator = BATCH_GENERATORS.get((category, difficulty))
+            if batch_generator is not None:
+                tasks = batch_generator(TASKS_PER_DIFFICULTY)
+            else:
+                tasks = [generator(difficulty, task_num)
+                         for task_num in range(1, TASKS_PER_DIFFICULTY + 1)]
             
-            # Save tasks
-            with open(diff_dir / "tasks.json", "w") as f:
-                json.dump(tasks, f, indent=2)
+            outputs.append((tasks, diff_dir / "tasks.json"))
             
             summary["categories"][category][difficulty] = len(tasks)
             summary["categories"][category]["total"] += len(tasks)
@@ -910,10 +997,11 @@ def generate_all_tasks():
             print(f"Generated {len(tasks)} tasks for {category}/{difficulty}")
     
     summary["total_tasks"] = total_tasks
+    outputs.append((summary, base_dir / "dataset_summary.json"))
     
-    # Save summary
-    with open(base_dir / "dataset_summary.json", "w") as f:
-        json.dump(summary, f, indent=2)
+    # The files are independent, so they are encoded and written side by side
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda item: dump_json(*item), outputs))
     
     print(f"\nTotal tasks generated: {total_tasks}")
     return summary
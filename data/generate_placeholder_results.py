@@ -5,13 +5,18 @@ Based on patterns observed in existing spatial reasoning benchmarks.
 """
 
 import json
-import random
 import numpy as np
 from pathlib import Path
 
-# Set seed for reproducibility
-random.seed(42)
-np.random.seed(42)
+try:
+    import orjson
+except ImportError:  # orjson is optional; json produces the same file, just slower
+    orjson = None
+
+# Seeded generator for reproducibility. A RandomState instance rather than
+# default_rng: it yields the same values the global np.random.seed(42) stream
+# did, so the published placeholder numbers do not change.
+RNG = np.random.RandomState(42)
 
 # Model performance baselines (based on existing benchmark patterns)
 MODEL_BASELINES = {
@@ -48,6 +53,29 @@ DIFFICULTY_MODIFIERS = {
     "hard": 0.75
 }
 
+# The modifiers as arrays, in dict order, for computing all cells at once
+CATEGORY_MODS = np.array(list(CATEGORY_MODIFIERS.values()))
+DIFFICULTY_MODS = np.array(list(DIFFICULTY_MODIFIERS.values()))
+
+# Model-independent parts of the base scores: the (category, difficulty)
+# modifier product and the reasoning and efficiency scale factors
+MOD_MATRIX = np.outer(CATEGORY_MODS, DIFFICULTY_MODS)
+REASONING_FACTORS = CATEGORY_MODS * 0.3 + 0.7
+EFFICIENCY_FACTORS = DIFFICULTY_MODS * 0.3 + 0.7
+
+# Tier of each category, in CATEGORY_MODIFIERS order
+CATEGORY_TIERS = np.array([
+    "tier1" if category in ["coordinate_understanding", "geometric_reasoning",
+                            "distance_computation", "topological_reasoning"]
+    else "tier2" if category in ["navigation_pathfinding", "viewpoint_visibility",
+                                 "pattern_recognition", "network_infrastructure"]
+    else "tier3"
+    for category in CATEGORY_MODIFIERS
+])
+
+# Standard deviation of the noise added to (accuracy, reasoning, efficiency)
+NOISE_SCALES = (0.03, 0.2, 0.05)
+
 def generate_model_results(model_name, baseline):
     """Generate results for a single model across all categories and difficulties."""
     results = {
@@ -58,47 +86,36 @@ def generate_model_results(model_name, baseline):
         "by_difficulty": {}
     }
     
-    all_accuracies = []
-    tier_accuracies = {"tier1": [], "tier2": [], "tier3": []}
-    
-    for category, cat_mod in CATEGORY_MODIFIERS.items():
-        results["by_category"][category] = {}
-        
-        # Determine tier
-        if category in ["coordinate_understanding", "geometric_reasoning", 
-                        "distance_computation", "topological_reasoning"]:
-            tier = "tier1"
-        elif category in ["navigation_pathfinding", "viewpoint_visibility",
-                          "pattern_recognition", "network_infrastructure"]:
-            tier = "tier2"
-        else:
-            tier = "tier3"
-        
-        for difficulty, diff_mod in DIFFICULTY_MODIFIERS.items():
-            # Calculate accuracy with some random variation
-            base_acc = baseline["accuracy"] * cat_mod * diff_mod
-            acc = min(0.98, max(0.15, base_acc + np.random.normal(0, 0.03)))
-            
-            # Calculate reasoning score (1-5 scale)
-            base_reasoning = baseline["reasoning"] * (cat_mod * 0.3 + 0.7)
-            reasoning = min(5.0, max(1.0, base_reasoning + np.random.normal(0, 0.2)))
-            
-            # Calculate efficiency
-            base_eff = baseline["efficiency"] * (diff_mod * 0.3 + 0.7)
-            efficiency = min(1.0, max(0.3, base_eff + np.random.normal(0, 0.05)))
-            
-            results["by_category"][category][difficulty] = {
-                "accuracy": round(acc * 100, 1),
-                "reasoning": round(reasoning, 2),
-                "efficiency": round(efficiency, 2),
+    # One draw covers every (category, difficulty) cell. The last axis is
+    # (accuracy, reasoning, efficiency), so the values come out of the
+    # generator in the same order as three separate draws per cell.
+    noise = RNG.normal(0, NOISE_SCALES, size=(len(CATEGORY_MODS), len(DIFFICULTY_MODS), 3))
+    
+    # Calculate accuracy with some random variation
+    base_acc = baseline["accuracy"] * MOD_MATRIX
+    accs = np.clip(base_acc + noise[..., 0], 0.15, 0.98)
+    
+    # Calculate reasoning score (1-5 scale)
+    base_reasoning = baseline["reasoning"] * REASONING_FACTORS
+    reasonings = np.clip(base_reasoning[:, None] + noise[..., 1], 1.0, 5.0)
+    
+    # Calculate efficiency
+    base_eff = baseline["efficiency"] * EFFICIENCY_FACTORS
+    efficiencies = np.clip(base_eff + noise[..., 2], 0.3, 1.0)
+    
+    for i, category in enumerate(CATEGORY_MODIFIERS):
+        results["by_category"][category] = {
+            difficulty: {
+                "accuracy": round(accs[i, j] * 100, 1),
+                "reasoning": round(reasonings[i, j], 2),
+                "efficiency": round(efficiencies[i, j], 2),
                 "n_tasks": 167
             }
-            
-            all_accuracies.append(acc)
-            tier_accuracies[tier].append(acc)
+            for j, difficulty in enumerate(DIFFICULTY_MODIFIERS)
+        }
     
     # Calculate aggregates
-    results["overall"]["accuracy"] = round(np.mean(all_accuracies) * 100, 1)
+    results["overall"]["accuracy"] = round(np.mean(accs) * 100, 1)
     results["overall"]["reasoning"] = round(baseline["reasoning"], 2)
     results["overall"]["efficiency"] = round(baseline["efficiency"], 2)
     
@@ -110,8 +127,8 @@ def generate_model_results(model_name, baseline):
     )
     
     # Tier aggregates
-    for tier, accs in tier_accuracies.items():
-        results["by_tier"][tier] = round(np.mean(accs) * 100, 1)
+    for tier in ("tier1", "tier2", "tier3"):
+        results["by_tier"][tier] = round(np.mean(accs[CATEGORY_TIERS == tier]) * 100, 1)
     
     # Difficulty aggregates
     for difficulty in ["easy", "medium", "hard"]:
@@ -160,6 +177,12 @@ def generate_leaderboard_table(results):
     
     return "\n".join(lines)
 
+def dumps_line(obj):
+    """Serialize obj as one compact JSON line, trailing newline included."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+    return (json.dumps(obj, separators=(",", ":")) + "\n").encode()
+
 def main():
     output_dir = Path("/home/ubuntu/spatial-benchmark/results")
     output_dir.mkdir(exist_ok=True)
@@ -168,8 +191,18 @@ def main():
     results = generate_all_results()
     
     # Save JSON results
-    with open(output_dir / "placeholder_results.json", "w") as f:
-        json.dump(results, f, indent=2)
+    if orjson is not None:
+        data = orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        data = json.dumps(results, indent=2).encode()
+    (output_dir / "placeholder_results.json").write_bytes(data)
+    
+    # The same results as JSON Lines: a header line with the benchmark
+    # metadata, then one line per model, so readers can parse model by model
+    header = {key: value for key, value in results.items() if key != "models"}
+    with open(output_dir / "placeholder_results.jsonl", "wb") as f:
+        f.write(dumps_line(header))
+        f.writelines(dumps_line(model) for model in results["models"])
     
     # Generate and save leaderboard
     leaderboard = generate_leaderboard_table(results)
@@ -0,0 +1,167 @@
+"""
+Numeric kernels for the SpatialEval dataset generators.
+
+Each kernel takes arrays already drawn from the generator's RNG and returns
+the computed answers, so the generated tasks are the same with or without numba.
+"""
+
+from collections import deque
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional; these kernels also run as plain Python
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def bfs_grid(obstacles, sx, sy, ex, ey, n):
+    """Shortest 4-connected path length on an n x n grid, or -1 if unreachable.
+
+    obstacles is an (n, n) uint8 array indexed [y, x]; nonzero cells are blocked.
+    """
+    visited = np.zeros((n, n), np.uint8)
+    qx = np.empty(n * n, np.int32)
+    qy = np.empty(n * n, np.int32)
+    qd = np.empty(n * n, np.int32)
+    head, tail = 0, 1
+    qx[0], qy[0], qd[0] = sx, sy, 0
+    visited[sy, sx] = 1
+    while head < tail:
+        cx, cy, dist = qx[head], qy[head], qd[head]
+        head += 1
+        if cx == ex and cy == ey:
+            return dist
+        for k in range(4):
+            if k == 0:
+                nx, ny = cx, cy + 1
+            elif k == 1:
+                nx, ny = cx, cy - 1
+            elif k == 2:
+                nx, ny = cx + 1, cy
+            else:
+                nx, ny = cx - 1, cy
+            if 0 <= nx < n and 0 <= ny < n and not visited[ny, nx] and not obstacles[ny, nx]:
+                visited[ny, nx] = 1
+                qx[tail], qy[tail], qd[tail] = nx, ny, dist + 1
+                tail += 1
+    return -1
+
+
+def bfs_packed(blocked: bytearray, start, end, n: int) -> int:
+    """Pure-Python counterpart of bfs_grid over flat cells indexed x * n + y.
+
+    Used when numba is missing: int cell ids and bytearray lookups avoid both
+    tuple hashing and per-element NumPy scalar access.
+    """
+    source, target = start[0] * n + start[1], end[0] * n + end[1]
+    visited = bytearray(n * n)
+    visited[source] = 1
+    queue = deque([(source, 0)])
+    while queue:
+        idx, dist = queue.popleft()
+        if idx == target:
+            return dist
+        x, y = divmod(idx, n)
+        for nxt, in_bounds in ((idx + 1, y + 1 < n), (idx - 1, y > 0),
+                               (idx + n, x + 1 < n), (idx - n, x > 0)):
+            if in_bounds and not visited[nxt] and not blocked[nxt]:
+                visited[nxt] = 1
+                queue.append((nxt, dist + 1))
+    return -1
+
+
+@njit(cache=True)
+def clip_segment_rect(x1, y1, x2, y2, x_min, y_min, x_max, y_max):
+    """Liang-Barsky clip of segment (x1, y1)-(x2, y2) against an axis-aligned box.
+
+    Returns 1 if the segment passes through the box interior, -1 if it misses
+    the box, and 0 if it only touches the boundary.
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    t_enter = 0.0
+    t_exit = 1.0
+    boundary = False
+    for k in range(4):
+        if k == 0:
+            p, q = -dx, x1 - x_min
+        elif k == 1:
+            p, q = dx, x_max - x1
+        elif k == 2:
+            p, q = -dy, y1 - y_min
+        else:
+            p, q = dy, y_max - y1
+        if p == 0:
+            if q < 0:
+                return -1
+            if q == 0:
+                boundary = True
+        elif p < 0:
+            t_enter = max(t_enter, q / p)
+        else:
+            t_exit = min(t_exit, q / p)
+    if t_enter > t_exit:
+        return -1
+    if boundary or t_enter == t_exit:
+        return 0
+    return 1
+
+
+@njit(cache=True)
+def bfs_csr(indptr, indices, start, end):
+    """Whether end is reachable from start in a graph in CSR form.
+
+    The neighbours of node v are indices[indptr[v]:indptr[v + 1]].
+    """
+    n = indptr.shape[0] - 1
+    visited = np.zeros(n, np.uint8)
+    queue = np.empty(n, np.int32)
+    queue[0] = start
+    visited[start] = 1
+    head, tail = 0, 1
+    while head < tail:
+        v = queue[head]
+        head += 1
+        if v == end:
+            return True
+        for k in range(indptr[v], indptr[v + 1]):
+            u = indices[k]
+            if not visited[u]:
+                visited[u] = 1
+                queue[tail] = u
+                tail += 1
+    return False
+
+
+@njit(cache=True)
+def come_within(gaps, rel_vels, radius_sq, t_max):
+    """Whether each pair of moving objects is within sqrt(radius_sq) at some whole second 0..t_max.
+
+    gaps and rel_vels are (n, 2) integer arrays of start-position and velocity
+    differences. The squared gap is a convex quadratic in t, so only the two
+    whole seconds either side of its vertex need checking.
+    """
+    n = gaps.shape[0]
+    out = np.empty(n, np.bool_)
+    for i in range(n):
+        dx, dy = gaps[i, 0], gaps[i, 1]
+        vx, vy = rel_vels[i, 0], rel_vels[i, 1]
+        a = vx * vx + vy * vy
+        b = 2 * (dx * vx + dy * vy)
+        c = dx * dx + dy * dy
+        if a == 0:
+            out[i] = c <= radius_sq
+            continue
+        t = min(max(-b // (2 * a), 0), t_max)
+        t_next = min(t + 1, t_max)
+        out[i] = (a * t * t + b * t + c <= radius_sq
+                  or a * t_next * t_next + b * t_next + c <= radius_sq)
+    return out
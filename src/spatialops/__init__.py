@@ -8,12 +8,22 @@ SpatialEval benchmark dataset.
 __version__ = "1.0.0"
 __author__ = "SpatialEval Team"
 
-from spatialops.data import load_dataset, load_category
-from spatialops.harness import Evaluator
+from spatialops.data import load_dataset, load_category, open_dataset
 
 __all__ = [
     "__version__",
     "load_dataset",
     "load_category",
+    "open_dataset",
     "Evaluator",
 ]
+
+
+def __getattr__(name):
+    # Evaluator pulls in numpy and tqdm, so it is imported on first use
+    # rather than by every "import spatialops" (e.g. the CLI's info command).
+    if name == "Evaluator":
+        from spatialops.harness import Evaluator
+
+        return Evaluator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,9 +3,6 @@ Command-line interface for SpatialEval.
 """
 
 import argparse
-import json
-import sys
-from pathlib import Path
 
 
 def main():
@@ -46,10 +43,32 @@ def main():
         help="Maximum number of tasks to evaluate",
     )
 
+    # Convert-data command
+    convert_parser = subparsers.add_parser(
+        "convert-data", help="Write a Parquet copy of every tasks.json for faster loading"
+    )
+    convert_parser.add_argument(
+        "--data-dir",
+        type=str,
+        default=None,
+        help="Path to the data directory",
+    )
+    convert_parser.add_argument(
+        "--compression",
+        type=str,
+        default="zstd",
+        help="Parquet compression codec",
+    )
+
     args = parser.parse_args()
 
     if args.command == "info":
         print_info()
+    elif args.command == "convert-data":
+        from spatialops.data import convert_to_parquet
+
+        written = convert_to_parquet(args.data_dir, compression=args.compression)
+        print(f"Wrote {len(written)} Parquet files")
     elif args.command == "evaluate":
         print("Evaluation harness coming soon!")
         print(f"Model: {args.model}")
@@ -6,10 +6,26 @@ or from the Hugging Face Hub.
 """
 
 import json
+import os
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # optional speedup; see the "speedups" extra
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional; LazyTaskList falls back to a full parse
+    ijson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
 # Define the 12 categories organized by tier
 TIER_1_CATEGORIES = [
     "coordinate_understanding",
@@ -34,6 +50,15 @@ TIER_3_CATEGORIES = [
 
 CATEGORIES = TIER_1_CATEGORIES + TIER_2_CATEGORIES + TIER_3_CATEGORIES
 
+# Tier of each category, for constant-time tier lookups and category checks
+_CATEGORY_TIER = {
+    category: tier
+    for tier, tier_categories in enumerate(
+        (TIER_1_CATEGORIES, TIER_2_CATEGORIES, TIER_3_CATEGORIES), start=1
+    )
+    for category in tier_categories
+}
+
 CATEGORY_CODES = {
     "coordinate_understanding": "CU",
     "geometric_reasoning": "GR",
@@ -50,6 +75,7 @@ CATEGORY_CODES = {
 }
 
 DIFFICULTIES = ["easy", "medium", "hard"]
+_DIFFICULTY_SET = frozenset(DIFFICULTIES)
 
 
 @dataclass
@@ -67,13 +93,196 @@ class Task:
     
     @property
     def tier(self) -> int:
-        if self.category in TIER_1_CATEGORIES:
-            return 1
-        elif self.category in TIER_2_CATEGORIES:
-            return 2
-        elif self.category in TIER_3_CATEGORIES:
-            return 3
-        return 0
+        return _CATEGORY_TIER.get(self.category, 0)
+
+
+class LazyTaskList:
+    """
+    The tasks of one tasks.json file, parsed as they are iterated.
+
+    With ijson installed the file is streamed, so only one task is in memory
+    at a time; without it each iteration parses the whole file. len() streams
+    through the file once and caches the count.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._len: Optional[int] = None
+
+    def __iter__(self) -> Iterator[dict]:
+        if ijson is None:
+            yield from _loads(self.path.read_bytes())
+            return
+        with open(self.path, "rb") as f:
+            yield from ijson.items(f, "item", use_float=True)
+
+    def __len__(self) -> int:
+        if self._len is None:
+            self._len = sum(1 for _ in self)
+        return self._len
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}('{self.path}')"
+
+
+def _stamp(path: Path) -> Tuple[int, int]:
+    """(mtime, size) of path, the cache key that makes an edited file be re-read."""
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+@lru_cache(maxsize=128)
+def _read_bytes(path: str, stamp: Tuple[int, int]) -> bytes:
+    """The contents of a tasks.json file, cached by _stamp."""
+    return Path(path).read_bytes()
+
+
+@lru_cache(maxsize=None)
+def _pyarrow():
+    """Import pyarrow on first use, as it is slow to import; None if it is missing."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:  # optional; without it only tasks.json files are read
+        return None
+    return pyarrow
+
+
+@lru_cache(maxsize=128)
+def _read_parquet_table(path: str, stamp: Tuple[int, int]):
+    """Read a tasks.parquet file written by convert_to_parquet(), cached by _stamp."""
+    return _pyarrow().parquet.read_table(path, memory_map=True)
+
+
+@lru_cache(maxsize=None)
+def _default_data_dir() -> Path:
+    """The data directory of the source tree, relative to this file."""
+    return Path(__file__).parent.parent.parent / "data"
+
+
+@lru_cache(maxsize=256)
+def _scan_dir(path: str, stamp: Tuple[int, int]) -> frozenset:
+    """List a directory, cached by _stamp, which changes when entries are added or removed."""
+    return frozenset(os.listdir(path))
+
+
+def _dir_entries(directory: Path) -> frozenset:
+    """The names in directory (empty if it does not exist), from one stat when unchanged."""
+    try:
+        stamp = _stamp(directory)
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
+    return _scan_dir(str(directory), stamp)
+
+
+def _task_files(
+    data_dir: Optional[Union[str, Path]],
+    categories: Optional[List[str]],
+    difficulties: Optional[List[str]],
+    tier: Optional[int],
+) -> Dict[str, Dict[str, Path]]:
+    """Validate a selection and map it to {category: {difficulty: tasks.json path}}."""
+    data_dir = _default_data_dir() if data_dir is None else Path(data_dir)
+
+    # Determine which categories to load
+    if tier is not None:
+        if tier == 1:
+            cats_to_load = TIER_1_CATEGORIES
+        elif tier == 2:
+            cats_to_load = TIER_2_CATEGORIES
+        elif tier == 3:
+            cats_to_load = TIER_3_CATEGORIES
+        else:
+            raise ValueError(f"Invalid tier: {tier}. Must be 1, 2, or 3.")
+    elif categories is not None:
+        cats_to_load = categories
+    else:
+        cats_to_load = CATEGORIES
+
+    if difficulties is None:
+        difficulties = DIFFICULTIES
+
+    # Validate the whole selection up front, reporting every unknown name
+    unknown = [category for category in cats_to_load if category not in _CATEGORY_TIER]
+    if unknown:
+        raise ValueError(
+            f"Unknown category: {', '.join(unknown)}. Valid categories: {CATEGORIES}"
+        )
+    unknown = [difficulty for difficulty in difficulties if difficulty not in _DIFFICULTY_SET]
+    if unknown:
+        raise ValueError(
+            f"Unknown difficulty: {', '.join(unknown)}. Valid difficulties: {DIFFICULTIES}"
+        )
+
+    return {
+        category: {
+            difficulty: data_dir / category / difficulty / "tasks.json"
+            for difficulty in difficulties
+        }
+        for category in cats_to_load
+    }
+
+
+def _read_task_file(task_file: Path) -> List[dict]:
+    """
+    The tasks in task_file, or an empty list if it does not exist.
+
+    A tasks.parquet next to it is read instead when pyarrow is available and
+    the Parquet file is at least as new as the JSON. Only the file contents are
+    cached; every call builds new task dicts, so callers may modify them.
+    """
+    entries = _dir_entries(task_file.parent)
+    has_json = task_file.name in entries
+    parquet_file = task_file.with_suffix(".parquet")
+    if parquet_file.name in entries and _pyarrow() is not None:
+        parquet_stamp = _stamp(parquet_file)
+        if not has_json or parquet_stamp[0] >= task_file.stat().st_mtime_ns:
+            return _read_parquet_table(str(parquet_file), parquet_stamp).to_pylist()
+    if not has_json:
+        return []
+    return _loads(_read_bytes(str(task_file), _stamp(task_file)))
+
+
+def convert_to_parquet(
+    data_dir: Optional[Union[str, Path]] = None,
+    compression: str = "zstd",
+) -> List[Path]:
+    """
+    Write a tasks.parquet next to every tasks.json in the dataset.
+
+    load_dataset() and open_dataset() prefer the Parquet copy while it is up
+    to date. A file whose tasks would not read back identically (for example,
+    mixed ground-truth types) is left as JSON only.
+
+    Args:
+        data_dir: Path to the data directory. If None, uses the default path.
+        compression: Parquet compression codec.
+
+    Returns:
+        The Parquet files written.
+    """
+    pa = _pyarrow()
+    if pa is None:
+        raise ImportError(
+            "pyarrow is required to convert the dataset. Install with: pip install pyarrow"
+        )
+
+    written = []
+    for files in _task_files(data_dir, None, None, None).values():
+        for task_file in files.values():
+            if task_file.name not in _dir_entries(task_file.parent):
+                continue
+            tasks = _loads(task_file.read_bytes())
+            try:
+                table = pa.Table.from_pylist(tasks)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                continue
+            if table.to_pylist() != tasks:
+                continue
+            parquet_file = task_file.with_suffix(".parquet")
+            pa.parquet.write_table(table, parquet_file, compression=compression)
+            written.append(parquet_file)
+    return written
 
 
 def load_dataset(
@@ -81,6 +290,8 @@ def load_dataset(
     categories: Optional[List[str]] = None,
     difficulties: Optional[List[str]] = None,
     tier: Optional[int] = None,
+    lazy: bool = False,
+    max_workers: int = 1,
 ) -> Dict[str, Dict[str, List[dict]]]:
     """
     Load the SpatialEval v2 benchmark dataset.
@@ -90,57 +301,124 @@ def load_dataset(
         categories: List of categories to load. If None, loads all categories.
         difficulties: List of difficulties to load. If None, loads all difficulties.
         tier: If specified, loads only categories from this tier (1, 2, or 3).
+        lazy: If True, each task list is a LazyTaskList that parses its file
+            while being iterated instead of up front.
+        max_workers: Number of threads reading files at once. Worth raising on
+            slow or network filesystems; for a local, cached data directory
+            the serial read is just as fast.
 
     Returns:
-        A nested dictionary: {category: {difficulty: [tasks]}}
+        A nested dictionary: {category: {difficulty: [tasks]}}. File contents
+        are cached, but each call returns its own task dicts.
 
     Example:
         >>> dataset = load_dataset()
         >>> print(len(dataset["coordinate_understanding"]["easy"]))
         167
     """
-    if data_dir is None:
-        # Default to the data directory relative to this file
-        data_dir = Path(__file__).parent.parent.parent / "data"
+    task_files = _task_files(data_dir, categories, difficulties, tier)
+
+    if lazy:
+        return {
+            category: {
+                difficulty: (
+                    LazyTaskList(task_file)
+                    if task_file.name in _dir_entries(task_file.parent)
+                    else []
+                )
+                for difficulty, task_file in files.items()
+            }
+            for category, files in task_files.items()
+        }
+
+    specs = [
+        (category, difficulty, task_file)
+        for category, files in task_files.items()
+        for difficulty, task_file in files.items()
+    ]
+    if max_workers > 1 and len(specs) > 1:
+        # The files are independent, so they can be read side by side
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(specs))) as executor:
+            loaded = list(executor.map(_read_task_file, [task_file for _, _, task_file in specs]))
     else:
-        data_dir = Path(data_dir)
+        loaded = [_read_task_file(task_file) for _, _, task_file in specs]
 
-    # Determine which categories to load
-    if tier is not None:
-        if tier == 1:
-            cats_to_load = TIER_1_CATEGORIES
-        elif tier == 2:
-            cats_to_load = TIER_2_CATEGORIES
-        elif tier == 3:
-            cats_to_load = TIER_3_CATEGORIES
-        else:
-            raise ValueError(f"Invalid tier: {tier}. Must be 1, 2, or 3.")
-    elif categories is not None:
-        cats_to_load = categories
-    else:
-        cats_to_load = CATEGORIES
+    dataset = {category: {} for category in task_files}
+    for (category, difficulty, _), tasks in zip(specs, loaded):
+        dataset[category][difficulty] = tasks
 
-    if difficulties is None:
-        difficulties = DIFFICULTIES
+    return dataset
 
-    dataset = {}
-    for category in cats_to_load:
-        if category not in CATEGORIES:
-            raise ValueError(f"Unknown category: {category}. Valid categories: {CATEGORIES}")
-        dataset[category] = {}
-        for difficulty in difficulties:
-            if difficulty not in DIFFICULTIES:
-                raise ValueError(
-                    f"Unknown difficulty: {difficulty}. Valid difficulties: {DIFFICULTIES}"
-                )
-            task_file = data_dir / category / difficulty / "tasks.json"
-            if task_file.exists():
-                with open(task_file, "r") as f:
-                    dataset[category][difficulty] = json.load(f)
-            else:
-                dataset[category][difficulty] = []
 
-    return dataset
+class LazyDataset(Mapping):
+    """
+    A {category: {difficulty: [tasks]}} mapping that reads each tasks.json
+    the first time its difficulty is looked up.
+
+    Iterating categories and difficulties touches no files, so a caller that
+    stops after a few tasks only parses the files it reached.
+    """
+
+    def __init__(self, task_files: Dict[str, Dict[str, Path]]):
+        self._categories = {
+            category: _LazyCategory(files) for category, files in task_files.items()
+        }
+
+    def __getitem__(self, category: str) -> "_LazyCategory":
+        return self._categories[category]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._categories)
+
+    def __len__(self) -> int:
+        return len(self._categories)
+
+    def materialize(self) -> Dict[str, Dict[str, List[dict]]]:
+        """Read every file and return the plain nested dict load_dataset would."""
+        return {category: dict(data.items()) for category, data in self.items()}
+
+
+class _LazyCategory(Mapping):
+    """The {difficulty: [tasks]} mapping of one category of a LazyDataset."""
+
+    def __init__(self, task_files: Dict[str, Path]):
+        self._files = task_files
+        self._tasks: Dict[str, List[dict]] = {}
+
+    def __getitem__(self, difficulty: str) -> List[dict]:
+        tasks = self._tasks.get(difficulty)
+        if tasks is None:
+            tasks = self._tasks[difficulty] = _read_task_file(self._files[difficulty])
+        return tasks
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._files)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+
+def open_dataset(
+    data_dir: Optional[Union[str, Path]] = None,
+    categories: Optional[List[str]] = None,
+    difficulties: Optional[List[str]] = None,
+    tier: Optional[int] = None,
+) -> LazyDataset:
+    """
+    Open the SpatialEval v2 benchmark dataset without reading it yet.
+
+    Takes the same arguments as load_dataset() and validates them up front,
+    but each tasks.json is only read when its tasks are first accessed.
+
+    Returns:
+        A LazyDataset. Call its materialize() method for a plain dict.
+
+    Example:
+        >>> dataset = open_dataset()
+        >>> print(len(dataset["coordinate_understanding"]["easy"]))
+        167
+    """
+    return LazyDataset(_task_files(data_dir, categories, difficulties, tier))
 
 
 def load_category(
@@ -237,11 +515,8 @@ def get_dataset_summary(dataset: Dict[str, Dict[str, List[dict]]]) -> Dict:
         summary["total_tasks"] += cat_total
         
         # Determine tier
-        if category in TIER_1_CATEGORIES:
-            summary["by_tier"][1] += cat_total
-        elif category in TIER_2_CATEGORIES:
-            summary["by_tier"][2] += cat_total
-        elif category in TIER_3_CATEGORIES:
-            summary["by_tier"][3] += cat_total
+        tier = _CATEGORY_TIER.get(category)
+        if tier is not None:
+            summary["by_tier"][tier] += cat_total
     
     return summary
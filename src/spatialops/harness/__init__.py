@@ -5,6 +5,7 @@ This module provides the core evaluation logic for running LLMs against
 the benchmark tasks and computing scores.
 """
 
+from spatialops.harness.cache import ResponseCache
 from spatialops.harness.evaluator import Evaluator
 from spatialops.harness.metrics import (
     compute_accuracy,
@@ -15,6 +16,7 @@ from spatialops.harness.metrics import (
 
 __all__ = [
     "Evaluator",
+    "ResponseCache",
     "compute_accuracy",
     "compute_reasoning_score",
     "compute_efficiency_score",
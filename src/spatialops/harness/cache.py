@@ -0,0 +1,78 @@
+"""
+Persistent cache of model responses for the SpatialEval evaluation harness.
+
+Re-running an evaluation with the same model and prompts (for example after
+changing a metric) reads responses from this cache instead of calling the
+model again.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+
+class ResponseCache:
+    """
+    A SQLite-backed store of model responses.
+
+    Entries are keyed by sha256 of (model_id, temperature, prompt), so a
+    different model or sampling temperature never reuses another's responses.
+    The cache is safe to share between the threads of one Evaluator run.
+
+    Example:
+        >>> cache = ResponseCache(".spatialops_cache/responses.sqlite", "gpt-5.2", 0.0)
+        >>> cache.put("What is 2 + 2?", "4")
+        >>> cache.get("What is 2 + 2?")
+        '4'
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        model_id: str,
+        temperature: Optional[float] = None,
+    ):
+        """
+        Open (or create) the cache.
+
+        Args:
+            path: Path to the SQLite database file.
+            model_id: Identifies the model whose responses are stored.
+            temperature: The sampling temperature the responses were made with.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.model_id = model_id
+        self.temperature = temperature
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response TEXT)"
+            )
+
+    def key(self, prompt: str) -> str:
+        """The cache key for a prompt."""
+        return hashlib.sha256(f"{self.model_id}|{self.temperature}|{prompt}".encode()).hexdigest()
+
+    def get(self, prompt: str) -> Optional[str]:
+        """The cached response for a prompt, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM responses WHERE key = ?", (self.key(prompt),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, prompt: str, response: str) -> None:
+        """Store the response for a prompt."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                (self.key(prompt), response),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
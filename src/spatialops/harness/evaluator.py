@@ -2,20 +2,61 @@
 Core Evaluator class for running SpatialEval benchmark evaluations.
 """
 
+import asyncio
+import inspect
 import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
 
+import numpy as np
 from tqdm import tqdm
 
-from spatialops.data import load_dataset
+from spatialops.data import open_dataset
+from spatialops.harness.cache import ResponseCache
 from spatialops.harness.metrics import (
+    _ResponseView,
     compute_accuracy,
     compute_efficiency_score,
     compute_reasoning_score,
     compute_spatialops_score,
 )
 
+try:
+    import orjson
+except ImportError:  # optional speedup; see the "speedups" extra
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _dumps_line(record: Dict[str, Any]) -> bytes:
+    """Serialize one result record as a line of JSONL."""
+    if orjson is not None:
+        return orjson.dumps(
+            record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(record).encode() + b"\n"
+
+
+def _read_stream(stream_path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Read the records already written to a results stream, keyed by task_id.
+
+    A last line left incomplete by an interrupted run is cut off the file so
+    that new records are appended after the last complete one.
+    """
+    if not stream_path.exists():
+        return {}
+    data = stream_path.read_bytes()
+    end = data.rfind(b"\n") + 1
+    if end < len(data):
+        with open(stream_path, "r+b") as f:
+            f.truncate(end)
+    records = (_loads(line) for line in data[:end].splitlines() if line.strip())
+    return {record["task_id"]: record for record in records}
+
 
 class Evaluator:
     """
@@ -25,8 +66,9 @@ class Evaluator:
     and computing the final scores.
 
     Attributes:
-        model_fn: A callable that takes a prompt string and returns a response string.
-        dataset: The loaded benchmark dataset.
+        model_fn: A callable that takes a prompt string and returns a response string,
+            or (for run_async) a coroutine function returning one.
+        dataset: The benchmark dataset, as a LazyDataset that reads each file on first use.
         results: A list of evaluation results for each task.
 
     Example:
@@ -40,10 +82,12 @@ class Evaluator:
 
     def __init__(
         self,
-        model_fn: Callable[[str], str],
+        model_fn: Union[Callable[[str], str], Callable[[str], Awaitable[str]]],
         data_dir: Optional[Path] = None,
         categories: Optional[List[str]] = None,
         difficulties: Optional[List[str]] = None,
+        cache_path: Optional[Path] = None,
+        model_id: Optional[str] = None,
     ):
         """
         Initialize the Evaluator.
@@ -53,9 +97,25 @@ class Evaluator:
             data_dir: Path to the data directory.
             categories: List of categories to evaluate on.
             difficulties: List of difficulties to evaluate on.
+            cache_path: If given, responses are stored in a SQLite cache at this
+                path (e.g. ".spatialops_cache/responses.sqlite") and reused on
+                later runs instead of calling the model again.
+            model_id: Identifies the model in the cache. Defaults to
+                model_fn.model_name, which the bundled model wrappers have.
         """
         self.model_fn = model_fn
-        self.dataset = load_dataset(
+        self.cache: Optional[ResponseCache] = None
+        if cache_path is not None:
+            model_id = model_id or getattr(model_fn, "model_name", None)
+            if model_id is None:
+                raise ValueError(
+                    "cache_path requires a model_id, or a model_fn with a model_name attribute."
+                )
+            self.cache = ResponseCache(
+                cache_path, model_id, getattr(model_fn, "temperature", None)
+            )
+        # Files are read as run() reaches them, so max_tasks limits the I/O too
+        self.dataset = open_dataset(
             data_dir=data_dir, categories=categories, difficulties=difficulties
         )
         self.results: List[Dict[str, Any]] = []
@@ -64,6 +124,9 @@ class Evaluator:
         self,
         max_tasks: Optional[int] = None,
         verbose: bool = True,
+        max_workers: int = 1,
+        batch: bool = False,
+        stream_path: Optional[Path] = None,
     ) -> Dict[str, Any]:
         """
         Run the evaluation on the loaded dataset.
@@ -71,73 +134,224 @@ class Evaluator:
         Args:
             max_tasks: Maximum number of tasks to evaluate. If None, evaluates all.
             verbose: Whether to show a progress bar.
+            max_workers: Number of threads calling model_fn at once. Model calls
+                are mostly waiting on the network, so raising this overlaps them;
+                leave it at 1 if model_fn is not thread-safe.
+            batch: Submit every prompt at once through model_fn.generate_batch
+                (e.g. the OpenAI and Anthropic batch APIs). Batch jobs can take
+                hours to complete, so this is never chosen automatically.
+            stream_path: If given, each result is appended to this JSONL file as
+                soon as it is scored. Tasks already recorded in the file (from
+                an earlier, interrupted run) are not evaluated again.
 
         Returns:
             A dictionary containing the overall scores and per-category breakdowns.
         """
-        self.results = []
-        task_count = 0
+        all_tasks = self._collect_tasks(max_tasks)
+        done = _read_stream(Path(stream_path)) if stream_path is not None else {}
+        todo = [item for item in all_tasks if item[2]["task_id"] not in done]
+        prompts = [task["prompt"] for _, _, task in todo]
 
-        all_tasks = []
-        for category, category_data in self.dataset.items():
-            for difficulty, tasks in category_data.items():
-                for task in tasks:
-                    all_tasks.append((category, difficulty, task))
+        if batch:
+            generate_batch = getattr(self.model_fn, "generate_batch", None)
+            if generate_batch is None:
+                raise ValueError("batch=True requires a model_fn with a generate_batch method.")
+            # A resumed run may have nothing left to send, and the batch APIs reject empty jobs
+            responses = self._generate_batch_cached(generate_batch, prompts) if prompts else []
+            self.results = self._write_results(
+                (self._score(*item, response) for item, response in zip(todo, responses)),
+                stream_path,
+            )
+        elif max_workers > 1:
+            # Responses come back in task order; metrics stay on this thread
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = executor.map(self._call_model, prompts)
+                if verbose:
+                    responses = tqdm(responses, total=len(prompts), desc="Evaluating")
+                self.results = self._write_results(
+                    (self._score(*item, response) for response, item in zip(responses, todo)),
+                    stream_path,
+                )
+        else:
+            iterator = tqdm(todo, desc="Evaluating") if verbose else todo
+            self.results = self._write_results(
+                (self._score(category, difficulty, task, self._call_model(task["prompt"]))
+                 for category, difficulty, task in iterator),
+                stream_path,
+            )
 
-        if max_tasks is not None:
-            all_tasks = all_tasks[:max_tasks]
+        if done:
+            # Merge back the earlier run's records, keeping task order
+            new_results = iter(self.results)
+            self.results = [done.get(task["task_id"]) or next(new_results)
+                            for _, _, task in all_tasks]
 
-        iterator = tqdm(all_tasks, desc="Evaluating") if verbose else all_tasks
+        return self._compute_final_scores()
 
-        for category, difficulty, task in iterator:
-            prompt = task["prompt"]
-            ground_truth = task["ground_truth"]
+    async def run_async(
+        self,
+        max_tasks: Optional[int] = None,
+        verbose: bool = True,
+        max_concurrency: int = 32,
+    ) -> Dict[str, Any]:
+        """
+        Run the evaluation with up to max_concurrency model calls in flight.
 
-            # Get model response
-            response = self.model_fn(prompt)
+        A coroutine model_fn is awaited directly; a plain callable is run in a
+        worker thread with asyncio.to_thread.
 
-            # Compute individual metrics
-            accuracy = compute_accuracy(response, ground_truth)
-            reasoning = compute_reasoning_score(response)
-            efficiency = compute_efficiency_score(response)
-
-            result = {
-                "task_id": task["task_id"],
-                "category": category,
-                "difficulty": difficulty,
-                "prompt": prompt,
-                "ground_truth": ground_truth,
-                "response": response,
-                "accuracy": accuracy,
-                "reasoning_score": reasoning,
-                "efficiency_score": efficiency,
-            }
-            self.results.append(result)
-            task_count += 1
+        Args:
+            max_tasks: Maximum number of tasks to evaluate. If None, evaluates all.
+            verbose: Whether to show a progress bar.
+            max_concurrency: Maximum number of model calls in flight at once.
 
+        Returns:
+            A dictionary containing the overall scores and per-category breakdowns.
+        """
+        all_tasks = self._collect_tasks(max_tasks)
+        semaphore = asyncio.Semaphore(max_concurrency)
+        is_async = inspect.iscoroutinefunction(self.model_fn) or inspect.iscoroutinefunction(
+            getattr(self.model_fn, "__call__", None)
+        )
+
+        async def call(prompt: str) -> str:
+            if self.cache is not None:
+                cached = self.cache.get(prompt)
+                if cached is not None:
+                    return cached
+            async with semaphore:
+                if is_async:
+                    response = await self.model_fn(prompt)
+                else:
+                    response = await asyncio.to_thread(self.model_fn, prompt)
+            if self.cache is not None:
+                self.cache.put(prompt, response)
+            return response
+
+        calls = [call(task["prompt"]) for _, _, task in all_tasks]
+        if verbose:
+            from tqdm.asyncio import tqdm as tqdm_asyncio
+
+            responses = await tqdm_asyncio.gather(*calls, desc="Evaluating")
+        else:
+            responses = await asyncio.gather(*calls)
+
+        self.results = [
+            self._score(*item, response) for item, response in zip(all_tasks, responses)
+        ]
         return self._compute_final_scores()
 
+    def _write_results(
+        self, results: Iterable[Dict[str, Any]], stream_path: Optional[Path]
+    ) -> List[Dict[str, Any]]:
+        """Collect results, appending each to stream_path (if given) as it arrives."""
+        if stream_path is None:
+            return list(results)
+        collected = []
+        with open(stream_path, "ab") as f:
+            for result in results:
+                f.write(_dumps_line(result))
+                f.flush()
+                collected.append(result)
+        return collected
+
+    def _call_model(self, prompt: str) -> str:
+        """Call model_fn, going through the response cache when there is one."""
+        if self.cache is None:
+            return self.model_fn(prompt)
+        response = self.cache.get(prompt)
+        if response is None:
+            response = self.model_fn(prompt)
+            self.cache.put(prompt, response)
+        return response
+
+    def _generate_batch_cached(
+        self, generate_batch: Callable[[List[str]], List[Optional[str]]], prompts: List[str]
+    ) -> List[str]:
+        """
+        Run generate_batch on only the prompts missing from the cache.
+
+        A request that failed inside the batch (None, or an empty response) is
+        scored as "" and left out of the cache, so a later run retries it.
+        """
+        if self.cache is None:
+            return [response or "" for response in generate_batch(prompts)]
+        responses = [self.cache.get(prompt) for prompt in prompts]
+        missing = [i for i, response in enumerate(responses) if response is None]
+        if missing:
+            for i, response in zip(missing, generate_batch([prompts[i] for i in missing])):
+                if response:
+                    self.cache.put(prompts[i], response)
+                responses[i] = response or ""
+        return responses
+
+    def _collect_tasks(self, max_tasks: Optional[int]) -> List[Tuple[str, str, dict]]:
+        """Flatten the dataset into (category, difficulty, task) triples."""
+        all_tasks = (
+            (category, difficulty, task)
+            for category, category_data in self.dataset.items()
+            for difficulty, tasks in category_data.items()
+            for task in tasks
+        )
+        return list(islice(all_tasks, max_tasks))
+
+    def _score(self, category: str, difficulty: str, task: dict, response: str) -> Dict[str, Any]:
+        """Compute the metrics for one response and build its result record."""
+        ground_truth = task["ground_truth"]
+
+        # Compute individual metrics, sharing one lowercased/split view
+        view = _ResponseView.from_str(response)
+        accuracy = compute_accuracy(view, ground_truth)
+        reasoning = compute_reasoning_score(view)
+        efficiency = compute_efficiency_score(view)
+
+        return {
+            "task_id": task["task_id"],
+            "category": category,
+            "difficulty": difficulty,
+            "prompt": task["prompt"],
+            "ground_truth": ground_truth,
+            "response": response,
+            "accuracy": accuracy,
+            "reasoning_score": reasoning,
+            "efficiency_score": efficiency,
+        }
+
     def _compute_final_scores(self) -> Dict[str, Any]:
         """Compute the final aggregated scores from individual results."""
         if not self.results:
             return {"error": "No results to compute scores from."}
 
-        total_accuracy = sum(r["accuracy"] for r in self.results) / len(self.results)
-        total_reasoning = sum(r["reasoning_score"] for r in self.results) / len(self.results)
-        total_efficiency = sum(r["efficiency_score"] for r in self.results) / len(self.results)
+        # One (accuracy, reasoning, efficiency) row and one category id per result
+        categories = list(self.dataset.keys())
+        category_ids = {category: i for i, category in enumerate(categories)}
+        metrics = np.array(
+            [(r["accuracy"], r["reasoning_score"], r["efficiency_score"]) for r in self.results],
+            dtype=np.float64,
+        )
+        ids = np.fromiter(
+            (category_ids[r["category"]] for r in self.results),
+            dtype=np.intp,
+            count=len(self.results),
+        )
 
+        total_accuracy, total_reasoning, total_efficiency = metrics.mean(axis=0).tolist()
         overall_score = compute_spatialops_score(
             total_accuracy, total_reasoning, total_efficiency
         )
 
-        # Per-category breakdown
+        # Per-category breakdown: per-category sums of each metric in one pass each
+        counts = np.bincount(ids, minlength=len(categories))
+        sums = np.stack(
+            [np.bincount(ids, weights=metrics[:, j], minlength=len(categories)) for j in range(3)],
+            axis=1,
+        )
+        means = sums / np.maximum(counts, 1)[:, None]
         category_scores = {}
-        for category in self.dataset.keys():
-            cat_results = [r for r in self.results if r["category"] == category]
-            if cat_results:
-                cat_acc = sum(r["accuracy"] for r in cat_results) / len(cat_results)
-                cat_reas = sum(r["reasoning_score"] for r in cat_results) / len(cat_results)
-                cat_eff = sum(r["efficiency_score"] for r in cat_results) / len(cat_results)
+        for category, count, (cat_acc, cat_reas, cat_eff) in zip(
+            categories, counts.tolist(), means.tolist()
+        ):
+            if count:
                 category_scores[category] = {
                     "accuracy": cat_acc,
                     "reasoning": cat_reas,
@@ -158,5 +372,9 @@ class Evaluator:
         """Save the detailed results to a JSON file."""
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            json.dump(self.results, f, indent=2)
+        if orjson is not None:
+            output_path.write_bytes(
+                orjson.dumps(self.results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            )
+        else:
+            output_path.write_text(json.dumps(self.results, indent=2))
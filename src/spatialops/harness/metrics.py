@@ -6,10 +6,45 @@ Accuracy, Reasoning Quality, and Efficiency.
 """
 
 import re
+from collections import deque
+from dataclasses import dataclass
 from typing import Any, Union
 
+_NUM_RE = re.compile(r"-?\d+\.?\d*")
+_MATH_RE = re.compile(r"\d+\s*[\+\-\*\/\=]\s*\d+")
+_STRUCT_RE = re.compile(r"(answer|result|solution)[\s:]+")
 
-def compute_accuracy(response: str, ground_truth: Any) -> float:
+# Phrases that signal step-by-step reasoning. No phrase is a prefix of another,
+# so the lookahead alternation finds every occurrence of every phrase in one
+# pass, and the set of matches is the set of phrases present.
+_REASONING_INDICATORS = (
+    "first", "second", "then", "next", "therefore", "thus",
+    "because", "since", "step", "calculate", "compute",
+    "the formula", "using", "applying", "we get", "we have",
+)
+_INDICATOR_RE = re.compile("(?=(%s))" % "|".join(map(re.escape, _REASONING_INDICATORS)))
+
+
+@dataclass(slots=True)
+class _ResponseView:
+    """A response with the derived forms the metrics need, computed once."""
+
+    raw: str
+    lower: str
+    words: int
+
+    @classmethod
+    def from_str(cls, response: str) -> "_ResponseView":
+        return cls(response, response.lower(), len(response.split()))
+
+
+def _view(response: Union[str, _ResponseView]) -> _ResponseView:
+    if isinstance(response, _ResponseView):
+        return response
+    return _ResponseView.from_str(response)
+
+
+def compute_accuracy(response: Union[str, _ResponseView], ground_truth: Any) -> float:
     """
     Compute the accuracy score for a single response.
 
@@ -17,19 +52,28 @@ def compute_accuracy(response: str, ground_truth: Any) -> float:
     the ground truth. It handles numeric answers, string answers, and lists.
 
     Args:
-        response: The model's response string.
+        response: The model's response string, or a view of it.
         ground_truth: The correct answer.
 
     Returns:
         A score between 0.0 and 1.0.
     """
     # Normalize the response
-    response_lower = response.lower().strip()
+    view = _view(response)
+    response_lower = view.lower.strip()
 
     # Handle numeric ground truths
     if isinstance(ground_truth, (int, float)):
+        # Fast path: the last number mentioned is usually the exact answer,
+        # and finding it does not need the list of every match
+        last = deque(_NUM_RE.finditer(view.raw), maxlen=1)
+        if not last:
+            return 0.0
+        if abs(float(last[0].group()) - ground_truth) < 1e-6:
+            return 1.0
+
         # Try to extract a number from the response
-        numbers = re.findall(r"-?\d+\.?\d*", response)
+        numbers = _NUM_RE.findall(view.raw)
         if numbers:
             # Check the last number mentioned (often the final answer)
             for num_str in reversed(numbers):
@@ -61,15 +105,20 @@ def compute_accuracy(response: str, ground_truth: Any) -> float:
 
     # Handle list ground truths (multiple acceptable answers)
     if isinstance(ground_truth, list):
+        # All-string lists are plain substring checks, done inline
+        if all(isinstance(gt, str) for gt in ground_truth):
+            if any(gt.lower().strip() in response_lower for gt in ground_truth):
+                return 1.0
+            return 0.0
         for gt in ground_truth:
-            if compute_accuracy(response, gt) > 0.5:
+            if compute_accuracy(view, gt) > 0.5:
                 return 1.0
         return 0.0
 
     return 0.0
 
 
-def compute_reasoning_score(response: str) -> float:
+def compute_reasoning_score(response: Union[str, _ResponseView]) -> float:
     """
     Compute the reasoning quality score for a response.
 
@@ -78,7 +127,7 @@ def compute_reasoning_score(response: str) -> float:
     would use an LLM-as-a-Judge approach.
 
     Args:
-        response: The model's response string.
+        response: The model's response string, or a view of it.
 
     Returns:
         A score between 0.0 and 1.0.
@@ -86,27 +135,23 @@ def compute_reasoning_score(response: str) -> float:
     score = 0.5  # Base score
 
     # Reward for showing work / step-by-step reasoning
-    reasoning_indicators = [
-        "first", "second", "then", "next", "therefore", "thus",
-        "because", "since", "step", "calculate", "compute",
-        "the formula", "using", "applying", "we get", "we have",
-    ]
-    response_lower = response.lower()
-    indicator_count = sum(1 for ind in reasoning_indicators if ind in response_lower)
+    view = _view(response)
+    response_lower = view.lower
+    indicator_count = len(set(_INDICATOR_RE.findall(response_lower)))
     score += min(indicator_count * 0.05, 0.3)
 
     # Reward for mathematical notation
-    if re.search(r"\d+\s*[\+\-\*\/\=]\s*\d+", response):
+    if _MATH_RE.search(view.raw):
         score += 0.1
 
     # Reward for structured output
-    if re.search(r"(answer|result|solution)[\s:]+", response_lower):
+    if _STRUCT_RE.search(response_lower):
         score += 0.1
 
     return min(score, 1.0)
 
 
-def compute_efficiency_score(response: str) -> float:
+def compute_efficiency_score(response: Union[str, _ResponseView]) -> float:
     """
     Compute the efficiency score for a response.
 
@@ -114,12 +159,12 @@ def compute_efficiency_score(response: str) -> float:
     overly verbose or repetitive answers.
 
     Args:
-        response: The model's response string.
+        response: The model's response string, or a view of it.
 
     Returns:
         A score between 0.0 and 1.0.
     """
-    word_count = len(response.split())
+    word_count = _view(response).words
 
     # Ideal range: 50-200 words for a spatial reasoning task
     if 50 <= word_count <= 200:
@@ -3,9 +3,10 @@ Anthropic model wrapper for SpatialEval.
 """
 
 import os
-from typing import Optional
+import time
+from typing import Any, Dict, List, Optional
 
-from spatialops.models.base import BaseModel
+from spatialops.models.base import BaseModel, _http_client
 
 
 class AnthropicModel(BaseModel):
@@ -55,9 +56,32 @@ class AnthropicModel(BaseModel):
                     "Anthropic API key not provided. Set ANTHROPIC_API_KEY environment variable "
                     "or pass api_key to the constructor."
                 )
-            self._client = anthropic.Anthropic(api_key=api_key)
+            self._client = anthropic.Anthropic(api_key=api_key, http_client=_http_client())
         return self._client
 
+    def close(self) -> None:
+        """Close the client's pooled connections."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:  # may run during interpreter shutdown
+            pass
+
+    def _request_params(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """Build the Messages API parameters for one prompt."""
+        return {
+            "model": self.model_name,
+            "max_tokens": kwargs.get("max_tokens", self.max_tokens),
+            "temperature": kwargs.get("temperature", self.temperature),
+            "system": "You are a helpful assistant specialized in spatial reasoning. "
+            "Solve the given problem step by step and provide a clear final answer.",
+            "messages": [{"role": "user", "content": prompt}],
+        }
+
     def generate(self, prompt: str, **kwargs) -> str:
         """
         Generate a response using the Anthropic API.
@@ -69,16 +93,43 @@ class AnthropicModel(BaseModel):
         Returns:
             The model's response string.
         """
-        temperature = kwargs.get("temperature", self.temperature)
-        max_tokens = kwargs.get("max_tokens", self.max_tokens)
-
-        response = self.client.messages.create(
-            model=self.model_name,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            system="You are a helpful assistant specialized in spatial reasoning. "
-            "Solve the given problem step by step and provide a clear final answer.",
-            messages=[{"role": "user", "content": prompt}],
-        )
+        response = self.client.messages.create(**self._request_params(prompt, **kwargs))
 
         return response.content[0].text
+
+    def generate_batch(
+        self, prompts: List[str], poll_interval: float = 30.0, **kwargs
+    ) -> List[Optional[str]]:
+        """
+        Generate responses for many prompts with one Message Batches API job.
+
+        The call blocks, polling every poll_interval seconds, until the batch
+        has ended. Requests that error or expire inside the batch get None
+        instead of a response, so callers can tell them apart and retry them.
+
+        Args:
+            prompts: The input prompts.
+            poll_interval: Seconds between status checks.
+            **kwargs: Additional parameters to pass to the API.
+
+        Returns:
+            The model's response strings (None for failed requests), in the
+            order of prompts.
+        """
+        if not prompts:
+            return []
+        batch = self.client.messages.batches.create(
+            requests=[
+                {"custom_id": f"request-{i}", "params": self._request_params(prompt, **kwargs)}
+                for i, prompt in enumerate(prompts)
+            ]
+        )
+        while batch.processing_status != "ended":
+            time.sleep(poll_interval)
+            batch = self.client.messages.batches.retrieve(batch.id)
+
+        responses = {}
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                responses[entry.custom_id] = entry.result.message.content[0].text
+        return [responses.get(f"request-{i}") for i in range(len(prompts))]
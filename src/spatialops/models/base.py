@@ -3,7 +3,30 @@ Base class for LLM model wrappers.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Optional
+
+
+def _http_client() -> Any:
+    """
+    An httpx client to share between all requests of one API client.
+
+    Keeps up to 64 connections alive so threaded and async runs reuse them
+    instead of opening new TLS connections, and speaks HTTP/2 (multiplexing
+    requests over one connection) when the h2 package is installed.
+    """
+    import httpx  # installed with the openai and anthropic SDKs
+
+    try:
+        import h2  # noqa: F401
+    except ImportError:  # optional; see the "speedups" extra
+        http2 = False
+    else:
+        http2 = True
+    return httpx.Client(
+        http2=http2,
+        timeout=httpx.Timeout(600.0, connect=5.0),
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+    )
 
 
 class BaseModel(ABC):
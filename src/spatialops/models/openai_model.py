@@ -2,10 +2,12 @@
 OpenAI model wrapper for SpatialEval.
 """
 
+import json
 import os
-from typing import Optional
+import time
+from typing import Any, Dict, List, Optional
 
-from spatialops.models.base import BaseModel
+from spatialops.models.base import BaseModel, _http_client
 
 
 class OpenAIModel(BaseModel):
@@ -55,9 +57,37 @@ class OpenAIModel(BaseModel):
                     "OpenAI API key not provided. Set OPENAI_API_KEY environment variable "
                     "or pass api_key to the constructor."
                 )
-            self._client = OpenAI(api_key=api_key)
+            self._client = OpenAI(api_key=api_key, http_client=_http_client())
         return self._client
 
+    def close(self) -> None:
+        """Close the client's pooled connections."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:  # may run during interpreter shutdown
+            pass
+
+    def _request_body(self, prompt: str, **kwargs) -> Dict[str, Any]:
+        """Build the chat completions request body for one prompt."""
+        return {
+            "model": self.model_name,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are a helpful assistant specialized in spatial reasoning. "
+                    "Solve the given problem step by step and provide a clear final answer.",
+                },
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": kwargs.get("temperature", self.temperature),
+            "max_tokens": kwargs.get("max_tokens", self.max_tokens),
+        }
+
     def generate(self, prompt: str, **kwargs) -> str:
         """
         Generate a response using the OpenAI API.
@@ -69,21 +99,60 @@ class OpenAIModel(BaseModel):
         Returns:
             The model's response string.
         """
-        temperature = kwargs.get("temperature", self.temperature)
-        max_tokens = kwargs.get("max_tokens", self.max_tokens)
+        response = self.client.chat.completions.create(**self._request_body(prompt, **kwargs))
 
-        response = self.client.chat.completions.create(
-            model=self.model_name,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a helpful assistant specialized in spatial reasoning. "
-                    "Solve the given problem step by step and provide a clear final answer.",
-                },
-                {"role": "user", "content": prompt},
-            ],
-            temperature=temperature,
-            max_tokens=max_tokens,
+        return response.choices[0].message.content
+
+    def generate_batch(
+        self, prompts: List[str], poll_interval: float = 30.0, **kwargs
+    ) -> List[Optional[str]]:
+        """
+        Generate responses for many prompts with one OpenAI Batch API job.
+
+        The prompts are uploaded as a single JSONL file and the call blocks,
+        polling every poll_interval seconds, until the batch finishes (up to
+        the 24h completion window). Requests that fail inside the batch get None
+        instead of a response, so callers can tell them apart and retry them.
+
+        Args:
+            prompts: The input prompts.
+            poll_interval: Seconds between status checks.
+            **kwargs: Additional parameters to pass to the API.
+
+        Returns:
+            The model's response strings (None for failed requests), in the
+            order of prompts.
+        """
+        if not prompts:
+            return []
+        lines = [
+            json.dumps({
+                "custom_id": f"request-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._request_body(prompt, **kwargs),
+            })
+            for i, prompt in enumerate(prompts)
+        ]
+        batch_file = self.client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode()), purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
         )
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+        if batch.status != "completed":
+            raise RuntimeError(f"OpenAI batch {batch.id} ended with status '{batch.status}'")
 
-        return response.choices[0].message.content
+        responses = {}
+        if batch.output_file_id:
+            for line in self.client.files.content(batch.output_file_id).text.splitlines():
+                record = json.loads(line)
+                body = (record.get("response") or {}).get("body") or {}
+                if body.get("choices"):
+                    responses[record["custom_id"]] = body["choices"][0]["message"]["content"]
+        return [responses.get(f"request-{i}") for i in range(len(prompts))]
@@ -2,6 +2,9 @@
 Tests for the data loading module.
 """
 
+import json
+import os
+
 import pytest
 from pathlib import Path
 
@@ -42,3 +45,126 @@ def test_load_dataset_invalid_difficulty():
 
     with pytest.raises(ValueError, match="Unknown difficulty"):
         load_dataset(difficulties=["impossible"])
+
+
+def test_load_dataset_reports_all_unknown_categories():
+    """Test that every unknown category is named in the error."""
+    from spatialops.data import load_dataset
+
+    with pytest.raises(ValueError, match="Unknown category: bogus, also_bogus"):
+        load_dataset(categories=["bogus", "coordinate_understanding", "also_bogus"])
+
+
+def test_load_dataset_rereads_modified_file(tmp_path):
+    """Test that a cached tasks file is re-read once it changes on disk."""
+    from spatialops.data import load_dataset
+
+    task_file = tmp_path / "coordinate_understanding" / "easy" / "tasks.json"
+    task_file.parent.mkdir(parents=True)
+    task_file.write_text(json.dumps([{"task_id": "CU_easy_0001"}]))
+
+    first = load_dataset(tmp_path, categories=["coordinate_understanding"], difficulties=["easy"])
+    again = load_dataset(tmp_path, categories=["coordinate_understanding"], difficulties=["easy"])
+    assert first == again
+    assert (
+        first["coordinate_understanding"]["easy"] is not again["coordinate_understanding"]["easy"]
+    )
+
+    task_file.write_text(json.dumps([{"task_id": "CU_easy_0001"}, {"task_id": "CU_easy_0002"}]))
+    stat = task_file.stat()
+    os.utime(task_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    updated = load_dataset(tmp_path, categories=["coordinate_understanding"], difficulties=["easy"])
+    assert len(updated["coordinate_understanding"]["easy"]) == 2
+
+
+def test_load_dataset_returns_fresh_tasks(tmp_path):
+    """Test that changes to loaded tasks do not leak into the next load."""
+    from spatialops.data import load_dataset
+
+    task_file = tmp_path / "coordinate_understanding" / "easy" / "tasks.json"
+    task_file.parent.mkdir(parents=True)
+    task_file.write_text(json.dumps([{"task_id": "CU_easy_0001", "ground_truth": [1, 2]}]))
+
+    first = load_dataset(tmp_path, categories=["coordinate_understanding"], difficulties=["easy"])
+    task = first["coordinate_understanding"]["easy"][0]
+    task["prompt"] = "changed"
+    task["ground_truth"].append(3)
+
+    again = load_dataset(tmp_path, categories=["coordinate_understanding"], difficulties=["easy"])
+    assert again["coordinate_understanding"]["easy"] == [
+        {"task_id": "CU_easy_0001", "ground_truth": [1, 2]}
+    ]
+
+
+def test_load_dataset_sees_new_file(tmp_path):
+    """Test that a tasks file added after a load is found by the next one."""
+    from spatialops.data import load_dataset
+
+    task_dir = tmp_path / "coordinate_understanding" / "easy"
+    task_dir.mkdir(parents=True)
+    empty = load_dataset(tmp_path, categories=["coordinate_understanding"], difficulties=["easy"])
+    assert empty["coordinate_understanding"]["easy"] == []
+
+    (task_dir / "tasks.json").write_text(json.dumps([{"task_id": "CU_easy_0001"}]))
+    stat = task_dir.stat()
+    os.utime(task_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    loaded = load_dataset(tmp_path, categories=["coordinate_understanding"], difficulties=["easy"])
+    assert loaded["coordinate_understanding"]["easy"] == [{"task_id": "CU_easy_0001"}]
+
+
+def test_load_dataset_lazy(tmp_path):
+    """Test that lazy task lists yield the same tasks as an eager load."""
+    from spatialops.data import LazyTaskList, load_dataset
+
+    tasks = [{"task_id": f"DC_easy_{i:04d}", "ground_truth": i / 3} for i in range(1, 6)]
+    task_file = tmp_path / "distance_computation" / "easy" / "tasks.json"
+    task_file.parent.mkdir(parents=True)
+    task_file.write_text(json.dumps(tasks))
+
+    lazy = load_dataset(
+        tmp_path, categories=["distance_computation"], difficulties=["easy"], lazy=True
+    )
+    task_list = lazy["distance_computation"]["easy"]
+    assert isinstance(task_list, LazyTaskList)
+    assert len(task_list) == 5
+    assert list(task_list) == tasks
+
+
+def test_open_dataset_matches_load_dataset():
+    """Test that a materialized lazy dataset equals the eager load."""
+    from spatialops.data import get_task_count, load_dataset, open_dataset
+
+    dataset = open_dataset(tier=1, difficulties=["easy"])
+    eager = load_dataset(tier=1, difficulties=["easy"])
+    assert list(dataset) == list(eager)
+    assert dataset.materialize() == eager
+    assert get_task_count(dataset) == get_task_count(eager)
+
+
+def test_convert_to_parquet(tmp_path):
+    """Test that converted Parquet files load back as the same tasks."""
+    pytest.importorskip("pyarrow")
+    from spatialops.data import convert_to_parquet, load_dataset
+
+    tasks = [
+        {"task_id": f"RE_hard_{i:04d}", "prompt": "p", "ground_truth": "Yes"} for i in range(3)
+    ]
+    task_file = tmp_path / "real_estate_geospatial" / "hard" / "tasks.json"
+    task_file.parent.mkdir(parents=True)
+    task_file.write_text(json.dumps(tasks))
+
+    assert convert_to_parquet(tmp_path) == [task_file.with_suffix(".parquet")]
+    task_file.write_text("not json")
+    os.utime(task_file, ns=(0, 0))
+    dataset = load_dataset(tmp_path, categories=["real_estate_geospatial"], difficulties=["hard"])
+    assert dataset["real_estate_geospatial"]["hard"] == tasks
+
+
+def test_load_dataset_threaded():
+    """Test that a threaded load gives the same nested dict as a serial one."""
+    from spatialops.data import load_dataset
+
+    threaded = load_dataset(max_workers=4)
+    serial = load_dataset()
+    assert threaded == serial
+    assert list(threaded) == list(serial)
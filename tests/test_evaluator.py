@@ -0,0 +1,238 @@
+"""
+Tests for the Evaluator class.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from spatialops.harness.evaluator import Evaluator
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """A small dataset: two categories with three tasks each."""
+    for category in ("coordinate_understanding", "distance_computation"):
+        task_dir = tmp_path / category / "easy"
+        task_dir.mkdir(parents=True)
+        tasks = [
+            {"task_id": f"{category}_{i}", "prompt": f"What is {i} + {i}?", "ground_truth": 2 * i}
+            for i in range(1, 4)
+        ]
+        (task_dir / "tasks.json").write_text(json.dumps(tasks))
+    return tmp_path
+
+
+def answer(prompt: str) -> str:
+    """A model that gets every task right."""
+    n = int(prompt.split()[2])
+    return f"First, {n} + {n} = {2 * n}. The answer is {2 * n}."
+
+
+def make_evaluator(data_dir, model_fn=answer):
+    return Evaluator(
+        model_fn=model_fn,
+        data_dir=data_dir,
+        categories=["coordinate_understanding", "distance_computation"],
+        difficulties=["easy"],
+    )
+
+
+def test_run_serial(data_dir):
+    """Test a serial run scores every task."""
+    evaluator = make_evaluator(data_dir)
+    scores = evaluator.run(verbose=False)
+    assert scores["num_tasks"] == 6
+    assert scores["accuracy"] == 1.0
+
+
+def test_run_threaded_matches_serial(data_dir):
+    """Test that a threaded run gives the same results, in the same order."""
+    serial = make_evaluator(data_dir)
+    serial_scores = serial.run(verbose=False)
+    threaded = make_evaluator(data_dir)
+    threaded_scores = threaded.run(verbose=False, max_workers=4)
+    assert threaded_scores == serial_scores
+    assert threaded.results == serial.results
+
+
+def test_run_async_with_coroutine_model(data_dir):
+    """Test run_async awaits a coroutine model_fn and keeps task order."""
+
+    async def async_answer(prompt: str) -> str:
+        await asyncio.sleep(0)
+        return answer(prompt)
+
+    serial = make_evaluator(data_dir)
+    serial.run(verbose=False)
+    evaluator = make_evaluator(data_dir, async_answer)
+    scores = asyncio.run(evaluator.run_async(verbose=False, max_concurrency=2))
+    assert scores["num_tasks"] == 6
+    assert evaluator.results == serial.results
+
+
+def test_run_async_with_sync_model(data_dir):
+    """Test run_async runs a plain callable in worker threads."""
+    evaluator = make_evaluator(data_dir)
+    scores = asyncio.run(evaluator.run_async(verbose=False, max_tasks=4))
+    assert scores["num_tasks"] == 4
+
+
+def test_run_batch(data_dir):
+    """Test that batch=True sends every prompt through generate_batch once."""
+
+    class BatchModel:
+        def __init__(self):
+            self.batches = []
+
+        def __call__(self, prompt):
+            raise AssertionError("per-prompt call in batch mode")
+
+        def generate_batch(self, prompts):
+            self.batches.append(prompts)
+            return [answer(prompt) for prompt in prompts]
+
+    model = BatchModel()
+    evaluator = make_evaluator(data_dir, model)
+    scores = evaluator.run(verbose=False, batch=True)
+    assert len(model.batches) == 1
+    assert scores["num_tasks"] == 6
+    assert scores["accuracy"] == 1.0
+
+
+def test_run_batch_requires_generate_batch(data_dir):
+    """Test that batch=True rejects a plain callable."""
+    evaluator = make_evaluator(data_dir)
+    with pytest.raises(ValueError, match="generate_batch"):
+        evaluator.run(verbose=False, batch=True)
+
+
+def test_max_tasks_reads_only_needed_files(data_dir):
+    """Test that a short run leaves the files it did not reach unread."""
+    (data_dir / "distance_computation" / "easy" / "tasks.json").write_text("not json")
+    evaluator = make_evaluator(data_dir)
+    scores = evaluator.run(verbose=False, max_tasks=3)
+    assert scores["num_tasks"] == 3
+
+
+def test_response_cache_skips_repeat_calls(data_dir, tmp_path):
+    """Test that a second run with a cache makes no model calls."""
+    calls = []
+
+    def counting_model(prompt):
+        calls.append(prompt)
+        return answer(prompt)
+
+    def cached_evaluator():
+        return Evaluator(
+            model_fn=counting_model,
+            data_dir=data_dir,
+            categories=["coordinate_understanding", "distance_computation"],
+            difficulties=["easy"],
+            cache_path=tmp_path / "cache" / "responses.sqlite",
+            model_id="counter",
+        )
+
+    first_scores = cached_evaluator().run(verbose=False)
+    # The two categories share their three prompts
+    assert len(calls) == 3
+
+    second = cached_evaluator()
+    assert second.run(verbose=False, max_workers=3) == first_scores
+    assert asyncio.run(second.run_async(verbose=False)) == first_scores
+    assert len(calls) == 3
+
+
+def test_stream_path_resume_skips_empty_batch(data_dir, tmp_path):
+    """Test that a batch run with every task already streamed sends no batch."""
+    stream_path = tmp_path / "results.jsonl"
+
+    class BatchModel:
+        def __init__(self):
+            self.batches = []
+
+        def generate_batch(self, prompts):
+            self.batches.append(prompts)
+            return [answer(prompt) for prompt in prompts]
+
+    model = BatchModel()
+    first_scores = make_evaluator(data_dir, model).run(
+        verbose=False, batch=True, stream_path=stream_path
+    )
+    resumed = make_evaluator(data_dir, model).run(
+        verbose=False, batch=True, stream_path=stream_path
+    )
+    assert resumed == first_scores
+    assert len(model.batches) == 1
+
+
+def test_batch_failures_are_not_cached(data_dir, tmp_path):
+    """Test that requests that failed inside a batch are retried on the next run."""
+
+    class FlakyBatchModel:
+        model_name = "flaky"
+
+        def __init__(self):
+            self.batches = []
+
+        def generate_batch(self, prompts):
+            self.batches.append(prompts)
+            # The first batch loses its second request
+            failed = len(self.batches) == 1
+            return [None if failed and i == 1 else answer(p) for i, p in enumerate(prompts)]
+
+    model = FlakyBatchModel()
+    cache_path = tmp_path / "cache" / "responses.sqlite"
+    # One category, as the other repeats its prompts and would answer from the cache
+    options = dict(
+        data_dir=data_dir, categories=["coordinate_understanding"], cache_path=cache_path
+    )
+    first = Evaluator(model, **options)
+    first_scores = first.run(verbose=False, batch=True)
+    assert first_scores["accuracy"] < 1.0
+    assert first.results[1]["response"] == ""
+
+    second = Evaluator(model, **options)
+    assert second.run(verbose=False, batch=True)["accuracy"] == 1.0
+    assert model.batches[1] == ["What is 2 + 2?"]
+
+
+def test_response_cache_requires_model_id(data_dir, tmp_path):
+    """Test that a cache needs something to identify the model by."""
+    with pytest.raises(ValueError, match="model_id"):
+        Evaluator(model_fn=answer, data_dir=data_dir, cache_path=tmp_path / "c.sqlite")
+
+
+def test_save_results_round_trip(data_dir, tmp_path):
+    """Test that saved results load back unchanged."""
+    evaluator = make_evaluator(data_dir)
+    evaluator.run(verbose=False)
+    output_path = tmp_path / "out" / "results.json"
+    evaluator.save_results(output_path)
+    assert json.loads(output_path.read_text()) == evaluator.results
+
+
+def test_stream_path_resumes(data_dir, tmp_path):
+    """Test that a streamed run writes JSONL and a rerun skips recorded tasks."""
+    stream_path = tmp_path / "results.jsonl"
+    calls = []
+
+    def counting(prompt: str) -> str:
+        calls.append(prompt)
+        return answer(prompt)
+
+    first = make_evaluator(data_dir, counting)
+    first.run(max_tasks=4, verbose=False, stream_path=stream_path)
+    assert len(stream_path.read_text().splitlines()) == 4
+
+    # Simulate a crash partway through writing the next record
+    with open(stream_path, "a") as f:
+        f.write('{"task_id": "distance_compu')
+
+    second = make_evaluator(data_dir, counting)
+    scores = second.run(verbose=False, stream_path=stream_path)
+    assert len(calls) == 6
+    assert scores == make_evaluator(data_dir).run(verbose=False)
+    lines = stream_path.read_text().splitlines()
+    assert [json.loads(line) for line in lines] == second.results
@@ -4,6 +4,7 @@ Tests for the metrics module.
 
 import pytest
 from spatialops.harness.metrics import (
+    _ResponseView,
     compute_accuracy,
     compute_reasoning_score,
     compute_efficiency_score,
@@ -82,6 +83,19 @@ class TestComputeEfficiencyScore:
         assert score < 1.0
 
 
+class TestResponseView:
+    """Tests that the metrics score a precomputed view like the raw string."""
+
+    def test_view_matches_string(self):
+        """Test each metric on a string and on its view."""
+        response = "First, 3 + 4 = 7. Therefore, the Answer: Quadrant I, 7"
+        view = _ResponseView.from_str(response)
+        for gt in (7, "Quadrant I", ["no", "quadrant i"]):
+            assert compute_accuracy(view, gt) == compute_accuracy(response, gt)
+        assert compute_reasoning_score(view) == compute_reasoning_score(response)
+        assert compute_efficiency_score(view) == compute_efficiency_score(response)
+
+
 class TestComputeSpatialEvalScore:
     """Tests for the compute_spatialops_score function."""
 